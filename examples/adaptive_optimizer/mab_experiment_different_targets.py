@@ -16,7 +16,7 @@ from golem.core.optimisers.genetic.operators.crossover import CrossoverTypesEnum
 from golem.core.optimisers.genetic.operators.inheritance import GeneticSchemeTypesEnum
 from golem.core.optimisers.objective import Objective
 from golem.metrics.edit_distance import tree_edit_dist
-from golem.metrics.graph_metrics import spectral_dist, size_diff, degree_distance
+from golem.metrics.graph_metrics import get_spectral_dist_metric, get_size_diff_metric, degree_distance
 
 
 def generate_gnp_graphs(graph_size: int,
@@ -117,11 +117,11 @@ def run_experiment_graphs_ratio_edges_nodes(adaptive_mutation_type: MutationAgen
         # Setup objective that measures some graph-theoretic similarity measure
         objective = Objective(
             quality_metrics={
-                'sp_adj': partial(spectral_dist, target, kind='adjacency'),
-                'sp_lapl': partial(spectral_dist, target, kind='laplacian'),
+                'sp_adj': get_spectral_dist_metric(target, kind='adjacency'),
+                'sp_lapl': get_spectral_dist_metric(target, kind='laplacian'),
             },
             complexity_metrics={
-                'graph_size': partial(size_diff, target),
+                'graph_size': get_size_diff_metric(target),
                 'degree': partial(degree_distance, target),
             },
             is_multi_objective=True,
@@ -2,7 +2,7 @@ import os
 import random
 from functools import partial
 
-from typing import Callable
+from typing import Callable, Sequence, Tuple
 
 from golem.core.adapter.nx_adapter import BaseNetworkxAdapter
 from golem.core.dag.graph_verifier import GraphVerifier
@@ -18,13 +18,26 @@ from golem.structural_analysis.graph_sa.sa_requirements import StructuralAnalysi
 
 def get_opt_graph() -> OptGraph:
     """ Get diverse OptGraph. """
-    node4 = OptNode({'name': 'node4'})
-    node5 = OptNode({'name': 'node5'})
-    node6 = OptNode({'name': 'node6'})
-    node2 = OptNode({'name': 'node2'}, nodes_from=[node4, node5])
-    node3 = OptNode({'name': 'node3'}, nodes_from=[node6])
-    node1 = OptNode({'name': 'node1'}, nodes_from=[node2, node3])
-    return OptGraph(node1)
+    names = ['node1', 'node2', 'node3', 'node4', 'node5', 'node6']
+    edges = [(1, 0), (2, 0), (3, 1), (4, 1), (5, 2)]
+    return build_opt_graph(names, edges)
+
+
+def build_opt_graph(names: Sequence[str], edges: Sequence[Tuple[int, int]]) -> OptGraph:
+    """ Build OptGraph from flat list of node names and list of (parent, child) edges
+    given as indices in the list of names. """
+    parents = [[] for _ in names]
+    for parent, child in edges:
+        parents[child].append(parent)
+
+    nodes = [None] * len(names)
+
+    def build_node(idx: int) -> OptNode:
+        if nodes[idx] is None:
+            nodes[idx] = OptNode({'name': names[idx]}, nodes_from=[build_node(parent) for parent in parents[idx]])
+        return nodes[idx]
+
+    return OptGraph([build_node(idx) for idx in range(len(names))])
 
 
 def quality_custom_metric_1(_: OptGraph) -> float:
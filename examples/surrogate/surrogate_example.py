@@ -16,7 +16,7 @@ from golem.core.optimisers.meta.surrogate_optimizer import SurrogateEachNgenOpti
 from golem.core.optimisers.objective import Objective
 from golem.core.optimisers.optimization_parameters import GraphRequirements
 from golem.core.optimisers.optimizer import GraphGenerationParams, GraphOptimizer
-from golem.metrics.graph_metrics import spectral_dist
+from golem.metrics.graph_metrics import get_spectral_dist_metric
 
 
 def surrogate_graph_search_setup(target_graph: nx.DiGraph,
@@ -56,7 +56,7 @@ def surrogate_graph_search_setup(target_graph: nx.DiGraph,
     # Setup objective that measures some graph-theoretic similarity measure
     objective = Objective(
         quality_metrics={
-            'sp_adj': partial(spectral_dist, target_graph, kind='adjacency')
+            'sp_adj': get_spectral_dist_metric(target_graph, kind='adjacency')
         }
     )
 
@@ -7,6 +7,7 @@ from typing import Sequence, Type, Callable, Optional, List
 
 import networkx as nx
 import numpy as np
+from joblib import Parallel, delayed
 
 from examples.synthetic_graph_evolution.generators import generate_labeled_graph, graph_kinds
 from examples.synthetic_graph_evolution.utils import draw_graphs_subplots
@@ -15,17 +16,17 @@ from golem.core.optimisers.genetic.gp_optimizer import EvoGraphOptimizer
 from golem.core.optimisers.optimizer import GraphOptimizer
 from golem.metrics.edit_distance import get_edit_dist_metric, matrix_edit_dist
 from golem.metrics.graph_metrics import \
-    spectral_dist, size_diff, degree_distance_kernel, degree_distance, nxgraph_stats
+    get_spectral_dist_metric, get_size_diff_metric, degree_distance_kernel, degree_distance, nxgraph_stats
 
 
 def get_all_quality_metrics(target_graph):
     quality_metrics = {
         'edit_distance': get_edit_dist_metric(target_graph),
         'matrix_edit_dist': partial(matrix_edit_dist, target_graph),
-        'sp_adj': partial(spectral_dist, target_graph, kind='adjacency'),
-        'sp_lapl': partial(spectral_dist, target_graph, kind='laplacian'),
-        'sp_lapl_norm': partial(spectral_dist, target_graph, kind='laplacian_norm'),
-        'graph_size': partial(size_diff, target_graph),
+        'sp_adj': get_spectral_dist_metric(target_graph, kind='adjacency'),
+        'sp_lapl': get_spectral_dist_metric(target_graph, kind='laplacian'),
+        'sp_lapl_norm': get_spectral_dist_metric(target_graph, kind='laplacian_norm'),
+        'graph_size': get_size_diff_metric(target_graph),
         'degree_dist_mmd': partial(degree_distance_kernel, target_graph),
         'degree_dist': partial(degree_distance, target_graph),
     }
@@ -41,52 +42,48 @@ def run_experiments(optimizer_setup: Callable,
                     trial_timeout: Optional[int] = None,
                     trial_iterations: Optional[int] = None,
                     visualize: bool = False,
+                    n_jobs: int = 1,
+                    **setup_params,
                     ):
+    """Runs trials of the optimizer on each target graph kind and size.
+
+    Args:
+        n_jobs: number of trials of the same experiment that are run in parallel
+            (nested parallel evaluation inside the optimizers is limited by joblib).
+        setup_params: additional parameters for ``optimizer_setup``. For example,
+            ``initial_graphs`` can be built once and shared between all trials,
+            because optimizers adapt (i.e. copy) initial graphs.
+    """
     log = StringIO()
     if not node_types:
         node_types = ['X']
     for graph_name, num_nodes in product(graph_names, graph_sizes):
         experiment_id = f'Experiment [graph={graph_name} graph_size={num_nodes}]'
         file_name = f'{optimizer_cls.__name__[:-9]}_{graph_name}_n{num_nodes}_iter{trial_iterations}'
-        trial_results = []
-        for i in range(num_trials):
-            start_time = datetime.now()
-            print(f'\nTrial #{i} of {experiment_id} started at {start_time}', file=log)
-
-            # Generate random target graph and run the optimizer
-            target_graph = generate_labeled_graph(graph_name, num_nodes, node_types)
-            target_graph = target_graph.reverse()
-            # Run optimizer setup
-            optimizer, objective = optimizer_setup(target_graph,
-                                                   optimizer_cls=optimizer_cls,
-                                                   node_types=node_types,
-                                                   timeout=timedelta(minutes=trial_timeout) if trial_timeout else None,
-                                                   num_iterations=trial_iterations)
-            found_graphs = optimizer.optimise(objective)
-            found_graph = found_graphs[0] if isinstance(found_graphs, Sequence) else found_graphs
-            history = optimizer.history
-
-            trial_results.extend(history.final_choices)
-            found_nx_graph = BaseNetworkxAdapter().restore(found_graph)
+        run_trial_fn = partial(_run_experiment_trial,
+                               optimizer_setup=optimizer_setup,
+                               optimizer_cls=optimizer_cls,
+                               node_types=node_types,
+                               graph_name=graph_name,
+                               num_nodes=num_nodes,
+                               experiment_id=experiment_id,
+                               file_name=file_name,
+                               trial_timeout=trial_timeout,
+                               trial_iterations=trial_iterations,
+                               visualize=visualize,
+                               setup_params=setup_params)
+        trials = Parallel(n_jobs=n_jobs)(delayed(run_trial_fn)(i) for i in range(num_trials))
 
-            duration = datetime.now() - start_time
-            print(f'Trial #{i} finished, spent time: {duration}', file=log)
-            print('target graph stats: ', nxgraph_stats(target_graph), file=log)
-            print('found graph stats: ', nxgraph_stats(found_nx_graph), file=log)
-            if visualize:
-                draw_graphs_subplots(target_graph, found_nx_graph,
-                                     titles=['Target Graph', 'Found Graph'], show=False)
-                diversity_filename = f'./results/diversity_hist_{graph_name}_n{num_nodes}.gif'
-                history.show.diversity_population(save_path=diversity_filename)
-                history.show.diversity_line(show=False)
-                history.show.fitness_line()
-            result_dir = Path('results') / file_name
-            result_dir.mkdir(parents=True, exist_ok=True)
-            history.save(result_dir / f'history_trial_{i}.json')
+        trial_results = []
+        for trial_choices, trial_log, objective in trials:
+            trial_results.extend(trial_choices)
+            log.write(trial_log)
 
         # Compute mean & std for metrics of trials
         ff = objective.format_fitness
-        trial_metrics = np.array([ind.fitness.values for ind in trial_results])
+        trial_metrics = np.empty((len(trial_results), len(objective.metric_names)))
+        for i, ind in enumerate(trial_results):
+            trial_metrics[i] = ind.fitness.values
         trial_metrics_mean = trial_metrics.mean(axis=0)
         trial_metrics_std = trial_metrics.std(axis=0)
         print(f'{experiment_id} finished with metrics:\n'
@@ -97,17 +94,69 @@ def run_experiments(optimizer_setup: Callable,
     return log.getvalue()
 
 
+def _run_experiment_trial(i: int,
+                          optimizer_setup: Callable,
+                          optimizer_cls: Type[GraphOptimizer],
+                          node_types: Sequence[str],
+                          graph_name: str,
+                          num_nodes: int,
+                          experiment_id: str,
+                          file_name: str,
+                          trial_timeout: Optional[int],
+                          trial_iterations: Optional[int],
+                          visualize: bool,
+                          setup_params: dict):
+    log = StringIO()
+    start_time = datetime.now()
+    print(f'\nTrial #{i} of {experiment_id} started at {start_time}', file=log)
+
+    # Generate random target graph and run the optimizer
+    target_graph = generate_labeled_graph(graph_name, num_nodes, node_types)
+    target_graph = target_graph.reverse()
+    # Run optimizer setup
+    optimizer, objective = optimizer_setup(target_graph,
+                                           optimizer_cls=optimizer_cls,
+                                           node_types=node_types,
+                                           timeout=timedelta(minutes=trial_timeout) if trial_timeout else None,
+                                           num_iterations=trial_iterations,
+                                           **setup_params)
+    found_graphs = optimizer.optimise(objective)
+    found_graph = found_graphs[0] if isinstance(found_graphs, Sequence) else found_graphs
+    history = optimizer.history
+    found_nx_graph = BaseNetworkxAdapter().restore(found_graph)
+
+    duration = datetime.now() - start_time
+    print(f'Trial #{i} finished, spent time: {duration}', file=log)
+    print('target graph stats: ', nxgraph_stats(target_graph), file=log)
+    print('found graph stats: ', nxgraph_stats(found_nx_graph), file=log)
+    if visualize:
+        draw_graphs_subplots(target_graph, found_nx_graph,
+                             titles=['Target Graph', 'Found Graph'], show=False)
+        diversity_filename = f'./results/diversity_hist_{graph_name}_n{num_nodes}.gif'
+        history.show.diversity_population(save_path=diversity_filename)
+        history.show.diversity_line(show=False)
+        history.show.fitness_line()
+    result_dir = Path('results') / file_name
+    result_dir.mkdir(parents=True, exist_ok=True)
+    history.save(result_dir / f'history_trial_{i}.json')
+    return history.final_choices, log.getvalue(), objective.get_info()
+
+
 def run_trial(target_graph: nx.DiGraph,
               optimizer_setup: Callable,
               optimizer_cls: Type[GraphOptimizer] = EvoGraphOptimizer,
               timeout: Optional[timedelta] = None,
               num_iterations: Optional[int] = None,
-              node_types: Optional[List[str]] = None):
+              node_types: Optional[List[str]] = None,
+              **setup_params):
+    """Runs the optimizer built by ``optimizer_setup`` on the target graph.
+    Additional ``setup_params`` (e.g. shared ``initial_graphs``) are passed to ``optimizer_setup``."""
     optimizer, objective = optimizer_setup(target_graph,
                                            optimizer_cls=optimizer_cls,
                                            timeout=timeout,
                                            node_types=node_types,
-                                           num_iterations=num_iterations)
+                                           num_iterations=num_iterations,
+                                           **setup_params)
     found_graphs = optimizer.optimise(objective)
     found_graph = found_graphs[0] if isinstance(found_graphs, Sequence) else found_graphs
     history = optimizer.history
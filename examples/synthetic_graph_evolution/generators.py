@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Callable, Collection, Sequence, Optional
 
 import networkx as nx
@@ -8,6 +9,8 @@ from examples.synthetic_graph_evolution.utils import draw_graphs_subplots
 NumNodes = int
 DiGraphGenerator = Callable[[NumNodes], nx.DiGraph]
 
+_rng = np.random.default_rng()
+
 
 graph_generators: Dict[str, DiGraphGenerator] = {
     'line': lambda n: nx.path_graph(n, create_using=nx.DiGraph),
@@ -22,6 +25,9 @@ graph_generators: Dict[str, DiGraphGenerator] = {
 
 graph_kinds: Sequence[str] = tuple(graph_generators.keys())
 
+# Kinds of graphs with topology fully determined by the number of nodes
+deterministic_graph_kinds: Sequence[str] = ('line', 'star', '2ring', 'grid2d', 'hypercube')
+
 
 def generate_dag(n):
     """ Works good for small graphs (up to n=100000) """
@@ -35,24 +41,15 @@ def nx_to_directed(graph: nx.Graph) -> nx.DiGraph:
     if isinstance(graph, nx.DiGraph):
         return graph
 
-    dedges = set()
     digraph = nx.DiGraph()
-
-    for node, data in graph.nodes(data=True):
-        digraph.add_node(node, **data)
-
-    for u, v, data in graph.edges.data():
-        edge = (u, v)
-        inv_edge = (v, u)
-        if edge in dedges or inv_edge in dedges:
-            continue
-
-        if np.random.default_rng().random() > 0.5:
-            digraph.add_edge(*edge, **data)
-            dedges.add(edge)
-        else:
-            digraph.add_edge(*inv_edge, **data)
-            dedges.add(inv_edge)
+    digraph.add_nodes_from(graph.nodes(data=True))
+
+    # edges of nx.Graph are unique, so direction can be drawn
+    # for all of them at once without tracking of reversed duplicates
+    edges = graph.edges.data()
+    flips = _rng.random(len(edges)) <= 0.5
+    digraph.add_edges_from((v, u, data) if flip else (u, v, data)
+                           for (u, v, data), flip in zip(edges, flips))
     return digraph
 
 
@@ -100,11 +97,30 @@ def generate_labeled_graph(kind: str,
     """Generate randomly labeled graph of the specified kind and size,
     optionally enforce connectedness and direction. Important! With small specified size
     some methods can generate smaller graphs due to removal of unconnected components."""
-    nx_graph = graph_generators[kind](size)
+    if kind in deterministic_graph_kinds:
+        # copy, because postprocessing modifies node attributes inplace
+        nx_graph = _generate_deterministic_graph(kind, _effective_size(kind, size)).copy()
+    else:
+        nx_graph = graph_generators[kind](size)
     graph = postprocess_nx_graph(nx_graph, node_labels, connected, directed)
     return graph
 
 
+def _effective_size(kind: str, size: int) -> int:
+    """Returns the size that gives the same topology for the generator,
+    so that all sizes producing the same graph share one cached instance."""
+    if kind == 'grid2d':
+        return int(np.sqrt(size)) ** 2
+    elif kind == 'hypercube':
+        return 2 ** int(np.log2(size).round())
+    return size
+
+
+@lru_cache(maxsize=None)
+def _generate_deterministic_graph(kind: str, size: int) -> nx.Graph:
+    return graph_generators[kind](size)
+
+
 def _draw_sample_graphs(kind: str = 'gnp', sizes=tuple(range(5, 50, 5))):
     graphs = [generate_labeled_graph(kind, n) for n in sizes]
     draw_graphs_subplots(*graphs)
@@ -18,7 +18,8 @@ from golem.core.optimisers.genetic.operators.inheritance import GeneticSchemeTyp
 from golem.core.optimisers.objective import Objective
 from golem.core.optimisers.optimization_parameters import GraphRequirements
 from golem.core.optimisers.optimizer import GraphGenerationParams, GraphOptimizer, AlgorithmParameters
-from golem.metrics.graph_metrics import spectral_dist, size_diff, degree_distance
+from golem.metrics.graph_metrics import \
+    get_cached_metric, get_spectral_dist_metric, get_size_diff_metric, degree_distance
 
 
 def graph_search_setup(target_graph: Optional[nx.DiGraph] = None,
@@ -37,11 +38,11 @@ def graph_search_setup(target_graph: Optional[nx.DiGraph] = None,
         # Setup objective that measures some graph-theoretic similarity measure
         objective = Objective(
             quality_metrics={
-                'sp_adj': partial(spectral_dist, target_graph, kind='adjacency'),
-                'sp_lapl': partial(spectral_dist, target_graph, kind='laplacian'),
+                'sp_adj': get_cached_metric(get_spectral_dist_metric(target_graph, kind='adjacency')),
+                'sp_lapl': get_cached_metric(get_spectral_dist_metric(target_graph, kind='laplacian')),
             },
             complexity_metrics={
-                'graph_size': partial(size_diff, target_graph),
+                'graph_size': get_size_diff_metric(target_graph),
                 'degree': partial(degree_distance, target_graph),
             },
             is_multi_objective=True
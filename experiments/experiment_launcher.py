@@ -1,18 +1,22 @@
+import logging
 import os
+import pickle
 from abc import abstractmethod
 from datetime import timedelta, datetime
-from io import StringIO
+from hashlib import sha256
 from itertools import product
 from typing import Optional, Type, Sequence, List, Callable, Union, Tuple
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from networkx import DiGraph
 
 from examples.synthetic_graph_evolution.generators import generate_labeled_graph
 from examples.synthetic_graph_evolution.utils import draw_graphs_subplots
 from golem.core.adapter.nx_adapter import BaseNetworkxAdapter
 from golem.core.dag.graph import Graph
+from golem.core.log import default_log
 from golem.core.optimisers.genetic.gp_optimizer import EvoGraphOptimizer
 from golem.core.optimisers.objective import Objective
 from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
@@ -32,6 +36,7 @@ class BaseExperimentLauncher:
         self.trial_iterations = trial_iterations
         self.path_to_save = path_to_save
         self.is_save_visualizations = is_save_visualizations
+        self.log = default_log(self)
 
     @abstractmethod
     def launch(self, optimizer_setup: Callable, **kwargs):
@@ -48,18 +53,12 @@ class BaseExperimentLauncher:
 
     @staticmethod
     def _save_experiment_results(path_to_save: str, optimizer: GraphOptimizer):
-        """ Saves experiment result as it is required in ExperimentAnalyzer. """
-        os.makedirs(path_to_save, exist_ok=True)
-
+        """ Saves experiment result as it is required in ExperimentAnalyzer.
+        Directory ``path_to_save`` must already exist. """
         # save metrics
         obj_names = optimizer.objective.metric_names
-        fitness = dict.fromkeys(obj_names)
-        for ind in optimizer.best_individuals:
-            for j, metric in enumerate(obj_names):
-                if not fitness[metric]:
-                    fitness[metric] = []
-                fitness[metric].append(ind.fitness.values[j])
-        df_metrics = pd.DataFrame(fitness)
+        fitness = np.array([ind.fitness.values for ind in optimizer.best_individuals], dtype=np.float64)
+        df_metrics = pd.DataFrame(fitness.reshape(-1, len(obj_names)), columns=list(obj_names))
         df_metrics.to_csv(os.path.join(path_to_save, 'metrics.csv'))
 
         # save history
@@ -70,8 +69,8 @@ class BaseExperimentLauncher:
     def _save_visualizations(history: OptHistory, setup_name: str, path_to_save: str):
         """ Saves visualizations of results. """
         path_to_save = os.path.join(path_to_save, 'visualizations')
-        os.makedirs(path_to_save, exist_ok=True)
         diversity_path_to_save = os.path.join(path_to_save, 'diversity')
+        # creates both directories at once
         os.makedirs(diversity_path_to_save, exist_ok=True)
         diversity_filename = f'diversity_hist_{setup_name}.gif'
         history.show.diversity_population(save_path=os.path.join(diversity_path_to_save, diversity_filename))
@@ -98,65 +97,97 @@ class GraphStructureExperimentLauncher(BaseExperimentLauncher):
     def __init__(self, graph_names: List[str], graph_sizes: List[int], path_to_save: str,
                  is_save_visualizations: bool = True, optimizer_cls: Type[GraphOptimizer] = EvoGraphOptimizer,
                  node_types: Optional[Sequence[str]] = None, num_trials: int = 10, trial_timeout: Optional[int] = None,
-                 trial_iterations: Optional[int] = None):
+                 trial_iterations: Optional[int] = None, n_jobs: int = 1, cache_target_graphs: bool = False):
         super().__init__(path_to_save=path_to_save, is_save_visualizations=is_save_visualizations,
                          optimizer_cls=optimizer_cls, num_trials=num_trials, trial_timeout=trial_timeout,
                          trial_iterations=trial_iterations)
         self.graph_names = graph_names
         self.graph_sizes = graph_sizes
         self.node_types = node_types
+        self.n_jobs = n_jobs
+        self.cache_target_graphs = cache_target_graphs
 
     def launch(self, optimizer_setup: Callable, **kwargs):
         """
         Launches experiments for product of all graph names and graph sizes for specified number of trials.
+        Trials of the same experiment are independent, so they are run in parallel with ``n_jobs`` workers.
         :param optimizer_setup: function that setups all infrastructure for launches.
         """
-        log = StringIO()
         if not self.node_types:
             self.node_types = ['X']
         for graph_name, num_nodes in product(self.graph_names, self.graph_sizes):
             experiment_id = f'Experiment [graph={graph_name} graph_size={num_nodes}]'
-            trial_results = []
+            # directories of all trials are created at once before the trials start
             for i in range(self.num_trials):
-                setup_name = optimizer_setup.__name__
-                cur_path_to_save = os.path.join(self.path_to_save, setup_name, f'{graph_name}_{num_nodes}', str(i))
-                os.makedirs(cur_path_to_save, exist_ok=True)
-                start_time = datetime.now()
-                print(f'\nTrial #{i} of {experiment_id} started at {start_time}', file=log)
-
-                optimizer, objective, target_graph = self._launch_experiment(graph_name=graph_name,
-                                                                             num_nodes=num_nodes,
-                                                                             node_types=self.node_types,
-                                                                             optimizer_setup=optimizer_setup)
-
-                found_graphs = optimizer.optimise(objective)
-                found_graph = found_graphs[0] if isinstance(found_graphs, Sequence) else found_graphs
-                history = optimizer.history
-
-                trial_results.extend(history.final_choices)
-                found_nx_graph = BaseNetworkxAdapter().restore(found_graph)
-
-                duration = datetime.now() - start_time
-                print(f'Trial #{i} finished, spent time: {duration}', file=log)
-                print('target graph stats: ', nxgraph_stats(target_graph), file=log)
-                print('found graph stats: ', nxgraph_stats(found_nx_graph), file=log)
-
-                self._save_experiment_results(path_to_save=cur_path_to_save, optimizer=optimizer)
+                os.makedirs(self._get_trial_path(optimizer_setup, graph_name, num_nodes, i), exist_ok=True)
+            trials = Parallel(n_jobs=self.n_jobs)(
+                delayed(self._run_trial)(i, graph_name=graph_name, num_nodes=num_nodes,
+                                         experiment_id=experiment_id, optimizer_setup=optimizer_setup)
+                for i in range(self.num_trials))
 
-                if self.is_save_visualizations:
-                    self._save_visualizations(target_graph=target_graph, found_nx_graph=found_nx_graph,
-                                              history=history, setup_name=setup_name, path_to_save=cur_path_to_save)
+            trial_results = []
+            for trial_choices, objective in trials:
+                trial_results.extend(trial_choices)
 
             # Compute mean & std for metrics of trials
             ff = objective.format_fitness
-            trial_metrics = np.array([ind.fitness.values for ind in trial_results])
+            trial_metrics = np.empty((len(trial_results), len(objective.metric_names)))
+            for j, ind in enumerate(trial_results):
+                trial_metrics[j] = ind.fitness.values
             trial_metrics_mean = trial_metrics.mean(axis=0)
             trial_metrics_std = trial_metrics.std(axis=0)
-            print(f'{experiment_id} finished with metrics:\n'
-                  f'mean={ff(trial_metrics_mean)}\n'
-                  f'std={ff(trial_metrics_std)}',
-                  file=log)
-            print(log.getvalue())
+            self.log.message(f'{experiment_id} finished with metrics:\n'
+                             f'mean={ff(trial_metrics_mean)}\n'
+                             f'std={ff(trial_metrics_std)}')
+
+    def _run_trial(self, i: int, graph_name: str, num_nodes: int, experiment_id: str, optimizer_setup: Callable):
+        """ Runs one trial of the experiment and saves its results.
+        Log records of the trial are streamed as usual and also written to its directory.
+        Returns final choices of the trial and the objective. """
+        cur_path_to_save = self._get_trial_path(optimizer_setup, graph_name, num_nodes, i)
+        trial_log_handler = logging.FileHandler(os.path.join(cur_path_to_save, 'log.log'))
+        trial_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self.log.logger.addHandler(trial_log_handler)
+        try:
+            return self._run_logged_trial(i, graph_name=graph_name, num_nodes=num_nodes, experiment_id=experiment_id,
+                                          optimizer_setup=optimizer_setup, path_to_save=cur_path_to_save)
+        finally:
+            self.log.logger.removeHandler(trial_log_handler)
+            trial_log_handler.close()
+
+    def _get_trial_path(self, optimizer_setup: Callable, graph_name: str, num_nodes: int, i: int) -> str:
+        return os.path.join(self.path_to_save, optimizer_setup.__name__, f'{graph_name}_{num_nodes}', str(i))
+
+    def _run_logged_trial(self, i: int, graph_name: str, num_nodes: int, experiment_id: str,
+                          optimizer_setup: Callable, path_to_save: str):
+        setup_name = optimizer_setup.__name__
+        start_time = datetime.now()
+        self.log.message(f'Trial #{i} of {experiment_id} started at {start_time}')
+
+        optimizer, objective, target_graph = self._launch_experiment(graph_name=graph_name,
+                                                                     num_nodes=num_nodes,
+                                                                     node_types=self.node_types,
+                                                                     optimizer_setup=optimizer_setup,
+                                                                     trial_idx=i)
+
+        found_graphs = optimizer.optimise(objective)
+        found_graph = found_graphs[0] if isinstance(found_graphs, Sequence) else found_graphs
+        history = optimizer.history
+        found_nx_graph = BaseNetworkxAdapter().restore(found_graph)
+
+        duration = datetime.now() - start_time
+        self.log.message(f'Trial #{i} finished, spent time: {duration}')
+        # graph stats are computed only if they are going to be logged
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(f'target graph stats: {nxgraph_stats(target_graph)}')
+            self.log.info(f'found graph stats: {nxgraph_stats(found_nx_graph)}')
+
+        self._save_experiment_results(path_to_save=path_to_save, optimizer=optimizer)
+
+        if self.is_save_visualizations:
+            self._save_visualizations(target_graph=target_graph, found_nx_graph=found_nx_graph,
+                                      history=history, setup_name=setup_name, path_to_save=path_to_save)
+        return history.final_choices, objective.get_info()
 
     def _launch_experiment(self, optimizer_setup: Callable, **kwargs) \
             -> Tuple[GraphOptimizer, Objective, Union[Graph, DiGraph]]:
@@ -164,9 +195,12 @@ class GraphStructureExperimentLauncher(BaseExperimentLauncher):
         graph_name = kwargs['graph_name']
         num_nodes = kwargs['num_nodes']
         node_types = kwargs['node_types']
-        # Generate random target graph and run the optimizer
-        target_graph = generate_labeled_graph(graph_name, num_nodes, node_types)
-        target_graph = target_graph.reverse()
+        # Generate random target graph (or load the one generated for the same trial before) and run the optimizer
+        if self.cache_target_graphs:
+            target_graph = self._load_or_generate_target_graph(graph_name, num_nodes, node_types,
+                                                               trial_idx=kwargs.get('trial_idx', 0))
+        else:
+            target_graph = generate_labeled_graph(graph_name, num_nodes, node_types).reverse()
         # Run optimizer setup
         optimizer, objective = optimizer_setup(target_graph=target_graph,
                                                optimizer_cls=self.optimizer_cls,
@@ -176,6 +210,26 @@ class GraphStructureExperimentLauncher(BaseExperimentLauncher):
                                                num_iterations=self.trial_iterations)
         return optimizer, objective, target_graph
 
+    def _load_or_generate_target_graph(self, graph_name: str, num_nodes: int, node_types: Sequence[str],
+                                       trial_idx: int) -> DiGraph:
+        """ Loads target graph of the trial from the cache on disk or generates and caches it.
+        Allows to reuse the same target graphs when the experiment grid is launched again. """
+        cache_dir = os.path.join(self.path_to_save, '.gen_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        graph_id = f'{graph_name}|{num_nodes}|{",".join(node_types)}|{trial_idx}'
+        cache_path = os.path.join(cache_dir, f'{sha256(graph_id.encode()).hexdigest()}.pkl')
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+
+        target_graph = generate_labeled_graph(graph_name, num_nodes, node_types).reverse()
+        # write to a temporary file first, so that parallel trials never read a partially written graph
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(target_graph, f)
+        os.replace(tmp_path, cache_path)
+        return target_graph
+
     @staticmethod
     def _save_visualizations(history: OptHistory, setup_name: str, path_to_save: str, **kwargs):
         """ Saves visualizations of results. """
@@ -139,9 +139,7 @@ class Graph(ABC):
             Optional[Node]: relevant node (None if there is no such node)
         """
 
-        appropriate_nodes = list(filter(lambda x: x.uid == uid, self.nodes))
-
-        return appropriate_nodes[0] if appropriate_nodes else None
+        return next((node for node in self.nodes if node.uid == uid), None)
 
     @abstractmethod
     def __eq__(self, other_graph: 'Graph') -> bool:
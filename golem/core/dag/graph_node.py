@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from copy import copy
-from typing import List, Optional, Iterable
+from typing import Dict, List, Optional, Iterable, Tuple
 from uuid import uuid4
 
 
@@ -78,41 +77,63 @@ class GraphNode(ABC):
 
 def descriptive_id_recursive(current_node: GraphNode, visited_nodes=None) -> str:
     """ Returns descriptive id with nodes names. """
-    if visited_nodes is None:
-        visited_nodes = []
+    visited_nodes = list(visited_nodes) if visited_nodes is not None else []
+    full_path, _ = _descriptive_id_recursive(current_node, visited_nodes, {})
+    return full_path
+
+
+def _descriptive_id_recursive(current_node: GraphNode, visited_nodes: List[GraphNode],
+                              acyclic_ids: Dict[int, str]) -> Tuple[str, bool]:
+    """ Returns descriptive id with nodes names and if a cycle was met while building it.
+
+    Id of a node, which ancestors have no cycles, does not depend on the path the node is reached by.
+    Such ids are memoized in ``acyclic_ids``, so shared parents are described once instead of once per path. """
+    node_id = acyclic_ids.get(id(current_node))
+    if node_id is not None:
+        return node_id, False
 
+    if current_node in visited_nodes:
+        return 'ID_CYCLED', True
     node_label = current_node.description()
 
     full_path_items = []
-    if current_node in visited_nodes:
-        return 'ID_CYCLED'
+    is_cycled = False
+    # visited nodes are the nodes of the current path
     visited_nodes.append(current_node)
     if current_node.nodes_from:
         previous_items = []
         for parent_node in current_node.nodes_from:
-            previous_items.append(f'{descriptive_id_recursive(parent_node, copy(visited_nodes))};')
+            parent_id, is_parent_cycled = _descriptive_id_recursive(parent_node, visited_nodes, acyclic_ids)
+            is_cycled = is_cycled or is_parent_cycled
+            previous_items.append(f'{parent_id};')
         previous_items.sort()
         previous_items_str = ';'.join(previous_items)
 
         full_path_items.append(f'({previous_items_str})')
+    visited_nodes.pop()
     full_path_items.append(f'/{node_label}')
     full_path = ''.join(full_path_items)
-    return full_path
+    if not is_cycled:
+        acyclic_ids[id(current_node)] = full_path
+    return full_path, is_cycled
 
 
 def descriptive_id_recursive_nodes(current_node: GraphNode, visited_nodes=None) -> List[GraphNode]:
     """ Returns descriptive id with nodes, not with its names. """
-    if visited_nodes is None:
-        visited_nodes = []
-
+    visited_nodes = list(visited_nodes) if visited_nodes is not None else []
     full_path_items = []
+    _descriptive_id_recursive_nodes(current_node, visited_nodes, full_path_items)
+    return full_path_items
+
+
+def _descriptive_id_recursive_nodes(current_node: GraphNode, visited_nodes: List[GraphNode],
+                                    full_path_items: List[GraphNode]):
+    """ Appends nodes of the descriptive id to ``full_path_items``.
+    ``visited_nodes`` are the nodes of the current path. """
     if current_node in visited_nodes:
-        return []
+        return
     visited_nodes.append(current_node)
-    if current_node.nodes_from:
-        previous_items = []
-        for parent_node in current_node.nodes_from:
-            previous_items.extend(descriptive_id_recursive_nodes(parent_node, copy(visited_nodes)))
-        full_path_items.extend(previous_items)
+    for parent_node in current_node.nodes_from:
+        _descriptive_id_recursive_nodes(parent_node, visited_nodes, full_path_items)
+    visited_nodes.pop()
     full_path_items.append(current_node)
-    return full_path_items
@@ -1,4 +1,4 @@
-from typing import Sequence, List, TYPE_CHECKING, Callable, Union, Optional
+from typing import Sequence, List, TYPE_CHECKING, Callable, Union, Optional, Dict
 
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
 
@@ -19,12 +19,17 @@ def distance_to_root_level(graph: 'Graph', node: 'GraphNode') -> int:
     """
 
     def child_height(parent_node: 'GraphNode') -> int:
+        # the first child of each node in the order of graph nodes, as in ``graph.node_children``
+        first_children = {}
+        for graph_node in graph.nodes:
+            for graph_node_parent in graph_node.nodes_from:
+                first_children.setdefault(id(graph_node_parent), graph_node)
         height = 0
         for _ in range(graph.length):
-            node_children = graph.node_children(parent_node)
-            if node_children:
+            child = first_children.get(id(parent_node))
+            if child is not None:
                 height += 1
-                parent_node = node_children[0]
+                parent_node = child
             else:
                 return height
 
@@ -49,24 +54,12 @@ def nodes_from_layer(graph: 'Graph', layer_number: int) -> Sequence['GraphNode']
     Returns:
         all nodes from the surface to the ``layer_number`` layer
     """
-
-    def get_nodes(roots: Sequence['GraphNode'], current_height: int) -> Sequence['GraphNode']:
-        """Gets all the parent nodes of ``roots``
-
-        :param roots: nodes to get all subnodes from
-        :param current_height: current diving step depth
-
-        :return: all parent nodes of ``roots`` in one sequence:69
-        """
-        nodes = []
-        if current_height == layer_number:
-            nodes.extend(roots)
-        else:
-            for root in roots:
-                nodes.extend(get_nodes(root.nodes_from, current_height + 1))
-        return nodes
-
-    nodes = get_nodes(graph.root_nodes(), current_height=0)
+    if layer_number < 0:
+        return []
+    # nodes are collected layer by layer, one entry per path from the roots as in the depth-first order
+    nodes = list(graph.root_nodes())
+    for _ in range(layer_number):
+        nodes = [parent for node in nodes for parent in node.nodes_from]
     return nodes
 
 
@@ -76,22 +69,26 @@ def ordered_subnodes_hierarchy(node: 'GraphNode') -> List['GraphNode']:
     Returns:
         List['GraphNode']: hierarchical subnodes list starting from the bounded node
     """
-    started = {node}
+    # ids of nodes on the current search path and of already processed nodes
+    started = {id(node)}
     visited = set()
-
-    def subtree_impl(node):
-        nodes = [node]
-        for parent in node.nodes_from:
-            if parent in visited:
+    nodes = [node]
+    stack = [(node, iter(node.nodes_from))]
+    while stack:
+        cur_node, parents = stack[-1]
+        for parent in parents:
+            if id(parent) in visited:
                 continue
-            elif parent in started:
+            elif id(parent) in started:
                 raise ValueError('Can not build ordered node hierarchy: graph has cycle')
-            started.add(parent)
-            nodes.extend(subtree_impl(parent))
-            visited.add(parent)
-        return nodes
-
-    return subtree_impl(node)
+            started.add(id(parent))
+            nodes.append(parent)
+            stack.append((parent, iter(parent.nodes_from)))
+            break
+        else:
+            stack.pop()
+            visited.add(id(cur_node))
+    return nodes
 
 
 def node_depth(nodes: Union['GraphNode', Sequence['GraphNode']]) -> int:
@@ -109,33 +106,30 @@ def node_depth(nodes: Union['GraphNode', Sequence['GraphNode']]) -> int:
     for node in nodes:
         max_depth = 0
         # if node is a subnode of another node it has smaller depth
-        if node.uid in subnodes:
+        if id(node) in subnodes:
             continue
-        depth = 1
-        visited = []
-        if node in visited:
-            return -1
-        visited.append(node)
-        stack = [(node, depth, iter(node.nodes_from))]
+        # ids of nodes on the current search path
+        path = {id(node)}
+        stack = [(node, 1, iter(node.nodes_from))]
         while stack:
             curr_node, depth_now, parents = stack[-1]
-            try:
-                parent = next(parents)
-                subnodes.add(parent.uid)
-                if parent not in visited:
-                    visited.append(parent)
-                    if parent.uid in final_depth:
-                        # depth of the parent has been already calculated
-                        stack.append((parent, depth_now + final_depth[parent.uid], iter([])))
-                    else:
-                        stack.append((parent, depth_now + 1, iter(parent.nodes_from)))
-                else:
-                    return -1
-            except StopIteration:
-                _, depth_now, _ = stack.pop()
-                visited.pop()
+            parent = next(parents, None)
+            if parent is None:
+                stack.pop()
+                path.discard(id(curr_node))
                 max_depth = max(max_depth, depth_now)
-        final_depth[node.uid] = max_depth
+                continue
+            parent_id = id(parent)
+            if parent_id in path:
+                return -1
+            subnodes.add(parent_id)
+            path.add(parent_id)
+            if parent_id in final_depth:
+                # depth of the parent has been already calculated
+                stack.append((parent, depth_now + final_depth[parent_id], iter(())))
+            else:
+                stack.append((parent, depth_now + 1, iter(parent.nodes_from)))
+        final_depth[id(node)] = max_depth
     return max(final_depth.values())
 
 
@@ -151,19 +145,25 @@ def map_dag_nodes(transform: Callable, nodes: Sequence) -> Sequence:
     """
     mapped_nodes = {}
 
-    def map_impl(node):
-        already_mapped = mapped_nodes.get(id(node))
-        if already_mapped:
-            return already_mapped
-        # map node itself
-        mapped_node = transform(node)
-        # remember it to avoid recursion
-        mapped_nodes[id(node)] = mapped_node
-        # map its children
-        mapped_node.nodes_from = list(map(map_impl, node.nodes_from))
-        return mapped_node
+    for node in nodes:
+        if id(node) in mapped_nodes:
+            continue
+        # map node itself and remember it to avoid repeated mapping
+        mapped_nodes[id(node)] = transform(node)
+        stack = [(node, iter(node.nodes_from))]
+        while stack:
+            cur_node, parents = stack[-1]
+            for parent in parents:
+                if id(parent) not in mapped_nodes:
+                    mapped_nodes[id(parent)] = transform(parent)
+                    stack.append((parent, iter(parent.nodes_from)))
+                    break
+            else:
+                # all parents are mapped, so the edges can be restored
+                stack.pop()
+                mapped_nodes[id(cur_node)].nodes_from = [mapped_nodes[id(parent)] for parent in cur_node.nodes_from]
 
-    return list(map(map_impl, nodes))
+    return [mapped_nodes[id(node)] for node in nodes]
 
 
 def graph_structure(graph: 'Graph') -> str:
@@ -179,29 +179,44 @@ def graph_structure(graph: 'Graph') -> str:
 def graph_has_cycle(graph: 'Graph') -> bool:
     """ Returns True if the graph contains a cycle and False otherwise. Implements Depth-First Search."""
 
-    visited = {node.uid: False for node in graph.nodes}
-    stack = []
-    on_stack = {node.uid: False for node in graph.nodes}
-    for node in graph.nodes:
-        if visited[node.uid]:
+    parents_indices = _parents_indices(graph.nodes)
+    # 0 -- not visited, 1 -- on the current path of the search, 2 -- finished
+    colors = bytearray(len(parents_indices))
+    for idx in range(len(parents_indices)):
+        if colors[idx]:
             continue
-        stack.append(node)
-        while len(stack) > 0:
-            cur_node = stack[-1]
-            if not visited[cur_node.uid]:
-                visited[cur_node.uid] = True
-                on_stack[cur_node.uid] = True
+        colors[idx] = 1
+        stack = [(idx, iter(parents_indices[idx]))]
+        while stack:
+            cur_idx, parents = stack[-1]
+            for parent_idx in parents:
+                if colors[parent_idx] == 1:
+                    return True
+                elif colors[parent_idx] == 0:
+                    colors[parent_idx] = 1
+                    stack.append((parent_idx, iter(parents_indices[parent_idx])))
+                    break
             else:
-                on_stack[cur_node.uid] = False
+                colors[cur_idx] = 2
                 stack.pop()
-            for parent in cur_node.nodes_from:
-                if not visited[parent.uid]:
-                    stack.append(parent)
-                elif on_stack[parent.uid]:
-                    return True
     return False
 
 
+def _parents_indices(nodes: Sequence['GraphNode']) -> List[List[int]]:
+    """ Returns integer adjacency of the graph: indices of parents for each node in ``nodes``. """
+    node_indices = {id(node): idx for idx, node in enumerate(nodes)}
+    return [[node_indices[id(parent)] for parent in node.nodes_from] for node in nodes]
+
+
+def _children_index(nodes: Sequence['GraphNode']) -> Dict['GraphNode', List['GraphNode']]:
+    """ Returns children among ``nodes`` for each parent node, collected in a single pass over the edges. """
+    children = {}
+    for node in nodes:
+        for parent in node.nodes_from:
+            children.setdefault(parent, []).append(node)
+    return children
+
+
 def get_all_simple_paths(graph: 'Graph', source: 'GraphNode', target: 'GraphNode') \
         -> List[List[List['GraphNode']]]:
     """ Returns all simple paths from one node to another ignoring edge direction.
@@ -246,7 +261,7 @@ def get_connected_components(graph: 'Graph', nodes: Optional[List['GraphNode']])
         nodes: if provided, only connected components containing these nodes are returned
     Returns:
         List of connected components"""
-    def _bfs(graph: 'Graph', source: 'GraphNode'):
+    def _bfs(source: 'GraphNode'):
         seen = set()
         nextlevel = {source}
         while nextlevel:
@@ -255,14 +270,16 @@ def get_connected_components(graph: 'Graph', nodes: Optional[List['GraphNode']])
             for v in thislevel:
                 if v not in seen:
                     seen.add(v)
-                    nextlevel.update(set(v.nodes_from).union(set(graph.node_children(v))))
+                    nextlevel.update(v.nodes_from)
+                    nextlevel.update(nodes_children.get(v, ()))
         return seen
+    nodes_children = _children_index(graph.nodes)
     visited = set()
     nodes = nodes or graph.nodes
     components = []
     for node in nodes:
         if node not in visited:
-            c = _bfs(graph, node)
+            c = _bfs(node)
             visited.update(c)
             components.append(c)
     return components
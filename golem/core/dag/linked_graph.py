@@ -8,7 +8,7 @@ from golem.core.dag.graph import Graph, ReconnectType
 from golem.core.dag.graph_node import GraphNode
 from golem.core.dag.graph_utils import ordered_subnodes_hierarchy, node_depth, graph_has_cycle
 from golem.core.paths import copy_doc
-from golem.utilities.data_structures import ensure_wrapped_in_sequence, Copyable, remove_items
+from golem.utilities.data_structures import ensure_wrapped_in_sequence, Copyable, remove_items, UniqueList
 
 NodePostprocessCallable = Callable[[Graph, Sequence[GraphNode]], Any]
 
@@ -33,36 +33,60 @@ class LinkedGraph(Graph, Copyable):
     def _empty_postprocess(*args):
         pass
 
+    def __deepcopy__(self, memo=None):
+        memo = {} if memo is None else memo
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+
+        # Linked nodes are cloned without their parents first and relinked afterwards,
+        # so copying does not recurse along the chains of parent nodes
+        cloned_nodes = []
+        for node in self._nodes:
+            if id(node) in memo or hasattr(node, '__deepcopy__') or '_nodes_from' not in vars(node):
+                continue
+            node_cls = node.__class__
+            node_copy = node_cls.__new__(node_cls)
+            memo[id(node)] = node_copy
+            node_copy.__dict__.update({key: deepcopy(value, memo) for key, value in vars(node).items()
+                                       if key != '_nodes_from'})
+            cloned_nodes.append((node, node_copy))
+        for node, node_copy in cloned_nodes:
+            node_copy._nodes_from = UniqueList([deepcopy(parent, memo) for parent in node._nodes_from])
+
+        for key, value in self.__dict__.items():
+            setattr(result, key, deepcopy(value, memo))
+        return result
+
     @copy_doc(Graph.delete_node)
     def delete_node(self, node: GraphNode, reconnect: ReconnectType = ReconnectType.single) -> object:
         node_children_cached = self.node_children(node)
 
         self._nodes.remove(node)
-        for node_child in node_children_cached:
-            node_child.nodes_from.remove(node)
 
-        if reconnect == ReconnectType.single:
-            # if removed node had a single child
+        if reconnect == ReconnectType.all or \
+                reconnect == ReconnectType.single and len(node_children_cached) == 1:
+            # if removed node had a single child (or all are reconnected)
             # then reconnect it to preceding parent nodes.
-            if node.nodes_from and len(node_children_cached) == 1:
-                child = node_children_cached[0]
-                child.nodes_from.extend(node.nodes_from)
-        elif reconnect == ReconnectType.all:
-            if node.nodes_from:
-                for child in node_children_cached:
-                    child.nodes_from.extend(node.nodes_from)
-        elif reconnect == ReconnectType.none:
-            pass
+            new_parents = [parent for parent in node.nodes_from if parent is not node]
+        else:
+            new_parents = []
+        # the edge to the removed node and the reconnected edges are spliced in one pass over child parents
+        for node_child in node_children_cached:
+            child_parents = [parent for parent in node_child.nodes_from if parent is not node]
+            child_parents.extend([parent for parent in new_parents if parent not in child_parents])
+            node_child.nodes_from[:] = child_parents
 
         self._postprocess_nodes(self, self._nodes)
 
     @copy_doc(Graph.delete_subtree)
     def delete_subtree(self, subtree: GraphNode):
-        subtree_nodes = ordered_subnodes_hierarchy(subtree)
+        subtree_nodes = set(ordered_subnodes_hierarchy(subtree))
         self._nodes = remove_items(self._nodes, subtree_nodes)
         # prune all edges coming from the removed subtree
-        for subtree in self._nodes:
-            subtree.nodes_from = remove_items(subtree.nodes_from, subtree_nodes)
+        for node in self._nodes:
+            if any(parent in subtree_nodes for parent in node.nodes_from):
+                node.nodes_from = remove_items(node.nodes_from, subtree_nodes)
 
     @copy_doc(Graph.update_node)
     def update_node(self, old_node: GraphNode, new_node: GraphNode):
@@ -113,7 +137,7 @@ class LinkedGraph(Graph, Copyable):
 
     @copy_doc(Graph.connect_nodes)
     def connect_nodes(self, node_parent: GraphNode, node_child: GraphNode):
-        if node_child in self.node_children(node_parent):
+        if node_parent in node_child.nodes_from:
             return
         node_child.nodes_from.append(node_parent)
 
@@ -125,10 +149,13 @@ class LinkedGraph(Graph, Copyable):
         :param node: node to be deleted with all of its parents
         """
 
-        if not self.node_children(node):
-            self._nodes.remove(node)
-            for node in node.nodes_from:
-                self._clean_up_leftovers(node)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not self.node_children(node):
+                self._nodes.remove(node)
+                # parents are processed in their order, each one with all its leftovers
+                stack.extend(reversed(node.nodes_from))
 
     @copy_doc(Graph.disconnect_nodes)
     def disconnect_nodes(self, node_parent: GraphNode, node_child: GraphNode,
@@ -143,7 +170,8 @@ class LinkedGraph(Graph, Copyable):
         self._postprocess_nodes(self, self._nodes)
 
     def root_nodes(self) -> Sequence[GraphNode]:
-        return [node for node in self._nodes if not any(self.node_children(node))]
+        parent_ids = {id(parent) for node in self._nodes for parent in node.nodes_from}
+        return [node for node in self._nodes if id(node) not in parent_ids]
 
     @property
     def nodes(self) -> List[GraphNode]:
@@ -164,30 +192,27 @@ class LinkedGraph(Graph, Copyable):
     def descriptive_id(self) -> str:
         if self.length == 0:
             return 'EMPTY'
-        elif self.root_nodes():
-            return ''.join([r.descriptive_id for r in self.root_nodes()])
+        root_nodes = self.root_nodes()
+        if root_nodes:
+            return ''.join([r.descriptive_id for r in root_nodes])
         else:
-            return sorted(self.nodes, key=lambda x: x.uid)[0].descriptive_id
+            return min(self.nodes, key=lambda x: x.uid).descriptive_id
 
     @copy_doc(Graph.depth)
     @property
     def depth(self) -> int:
         if not self._nodes:
             return 0
-        elif not self.root_nodes() or graph_has_cycle(self):
+        root_nodes = self.root_nodes()
+        if not root_nodes or graph_has_cycle(self):
             return -1
         else:
-            depths = node_depth(self.root_nodes())
+            depths = node_depth(root_nodes)
             return max(ensure_wrapped_in_sequence(depths))
 
     @copy_doc(Graph.get_edges)
     def get_edges(self) -> Sequence[Tuple[GraphNode, GraphNode]]:
-        edges = []
-        for node in self._nodes:
-            if node.nodes_from:
-                for parent_node in node.nodes_from:
-                    edges.append((parent_node, node))
-        return edges
+        return [(parent_node, node) for node in self._nodes for parent_node in node.nodes_from]
 
 
 def get_distance_between(graph_1: Graph, graph_2: Graph) -> int:
@@ -1,3 +1,4 @@
+from sys import intern
 from typing import Union, Optional, Iterable, List
 from golem.core.dag.graph_node import GraphNode
 from golem.utilities.data_structures import UniqueList
@@ -23,6 +24,10 @@ class LinkedGraphNode(GraphNode):
         # Wrap string into dict if it is necessary
         if isinstance(content, str):
             content = {'name': content}
+        # Node names repeat a lot across graphs, interning makes their comparisons cheap
+        # (only exact str can be interned, the caller's content is left untouched)
+        if type(content.get('name')) is str:
+            content = {**content, 'name': intern(content['name'])}
 
         self.content: dict = content
         self._nodes_from = UniqueList(nodes_from or ())
@@ -64,13 +69,14 @@ class LinkedGraphNode(GraphNode):
 
     def description(self) -> str:
         label = self.name or self.uid
+        parameters = self.parameters
         # TODO: possibly unify with __repr__ & don't duplicate Operation.description
-        if not self.parameters:
+        if not parameters:
             node_label = f'n_{label}'
         elif isinstance(label, str):
             # If there is a string: name of operation (as in json repository)
-            node_label = f'n_{label}_{self.parameters}'
+            node_label = f'n_{label}_{parameters}'
         else:
             # If instance of Operation is placed in 'name'
-            node_label = label.description(self.parameters)
+            node_label = label.description(parameters)
         return node_label
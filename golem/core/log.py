@@ -14,6 +14,8 @@ from golem.core.paths import default_data_dir
 from golem.utilities.singleton_meta import SingletonMeta
 
 DEFAULT_LOG_PATH = pathlib.Path(default_data_dir(), 'log.log')
+# Level of the messages to user, between info and warning
+MESSAGE_LEVEL = 45
 
 
 class Log(metaclass=SingletonMeta):
@@ -166,8 +168,7 @@ class LoggerAdapter(logging.LoggerAdapter):
         """ Record the message to user.
         Message is an intermediate logging level between info and warning
         to display main info about optimization process """
-        level = 45
-        self.log(level, msg, **kwargs)
+        self.log(MESSAGE_LEVEL, msg, **kwargs)
 
     def log_or_raise(
             self, level: Union[int, Literal['debug', 'info', 'warning', 'error', 'critical', 'message']],
@@ -205,7 +206,7 @@ class LoggerAdapter(logging.LoggerAdapter):
                 'warning': logging.WARNING,
                 'error': logging.ERROR,
                 'critical': logging.CRITICAL,
-                'message': 45,
+                'message': MESSAGE_LEVEL,
             }
             if isinstance(level, str):
                 level = level_map[level]
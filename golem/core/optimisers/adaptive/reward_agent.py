@@ -1,5 +1,7 @@
 from typing import List, Tuple
 
+import numpy as np
+
 
 class FitnessRateRankRewardTransformer:
     """
@@ -14,18 +16,25 @@ class FitnessRateRankRewardTransformer:
     def get_rewards_for_arms(self, rewards: List[float], arms: List[int]) -> List[float]:
         unique_arms, decay_values = self.get_decay_values_for_arms(rewards, arms)
         frr_per_arm = self.get_fitness_rank_rate(decay_values)
-        frr_values = [frr_per_arm[unique_arms.index(arm)] for arm in arms]
+        arm_positions = {arm: position for position, arm in enumerate(unique_arms)}
+        frr_values = [frr_per_arm[arm_positions[arm]] for arm in arms]
         return frr_values
 
     def get_decay_values_for_arms(self, rewards: List[float], arms: List[int]) -> Tuple[List[int], List[float]]:
-        decays = dict.fromkeys(set(arms), 0.0)
-        for i, reward in enumerate(rewards):
-            decays[arms[i]] += reward
-        decays.update((key, value * self._decaying_factor) for key, value in decays.items())
-        return list(decays.keys()), list(decays.values())
+        # arms are indices of actions, so rewards can be grouped by them directly
+        arms = np.asarray(arms, dtype=np.intp)
+        decays = np.bincount(arms, weights=np.asarray(rewards, dtype=float))
+        unique_arms = np.flatnonzero(np.bincount(arms))
+        decays = decays[unique_arms]
+        if self._decaying_factor != 1.:
+            decays *= self._decaying_factor
+        return unique_arms.tolist(), decays.tolist()
 
     @staticmethod
     def get_fitness_rank_rate(decay_values: List[float]) -> List[float]:
         # abs() is used to save the initial sign of each decay value
-        total_decay_sum = abs(sum(decay_values))
-        return [decay / total_decay_sum for decay in decay_values] if total_decay_sum != 0 else [0.]*len(decay_values)
+        decay_values = np.asarray(decay_values, dtype=float)
+        total_decay_sum = abs(decay_values.sum())
+        if total_decay_sum == 0:
+            return [0.] * len(decay_values)
+        return (decay_values / total_decay_sum).tolist()
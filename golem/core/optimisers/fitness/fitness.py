@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Sequence, Any, Optional, Tuple
+from typing import Sequence, Any, Optional, Tuple, Union
 
 import numpy as np
 
@@ -56,6 +56,12 @@ class Fitness(Comparable):
         """Assess if a fitness is valid or not."""
         raise NotImplementedError()
 
+    def to_metric(self, default: float) -> Union[float, Sequence[float]]:
+        """Return metric value(s) of the fitness with ``default`` used in place of missing values.
+        By the default returns single value for single-valued fitness and tuple of values otherwise."""
+        metric_values = tuple(default if value is None else value for value in self.values)
+        return metric_values[0] if len(metric_values) == 1 else metric_values
+
     def dominates(self, other: 'Fitness', selector: Any = None) -> bool:
         """Implementation-specific test for fitness domination.
         By the default behaves same as less-than operator for valid fitness.
@@ -147,6 +153,9 @@ class SingleObjFitness(Fitness):
     def valid(self) -> bool:
         return self._values[0] is not None
 
+    def to_metric(self, default: float) -> float:
+        return self._values[0] if self._values[0] is not None else default
+
     def __hash__(self) -> int:
         # __hash__ required explicit super() call
         return super().__hash__()
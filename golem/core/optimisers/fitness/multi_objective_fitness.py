@@ -76,6 +76,9 @@ class MultiObjFitness(Fitness):
                        "in order to set the fitness and ``del individual.fitness.values`` "
                        "in order to clear (invalidate) the fitness."))
 
+    def to_metric(self, default: Real) -> Sequence[Real]:
+        return tuple(default if value is None else value for value in self.wvalues)
+
     def dominates(self, other: 'MultiObjFitness', selector=slice(None)):
         """Return true if each objective of *self* is not strictly worse than
         the corresponding objective of *other* and at least one objective is
@@ -1,6 +1,8 @@
 import itertools
 from copy import deepcopy
-from typing import Any, List, Tuple, Optional
+from typing import Any, List, Tuple, Optional, Set, Sequence
+
+import numpy as np
 
 from golem.core.dag.graph_node import descriptive_id_recursive_nodes
 from golem.core.dag.graph_utils import distance_to_primary_level
@@ -13,20 +15,20 @@ def equivalent_subtree(graph_first: Any, graph_second: Any, with_primary_nodes:
     Due to a lot of common subgraphs consisted only of single primary nodes, these nodes can be
     not considered with `with_primary_nodes=False`."""
 
-    pairs_list = []
+    pairs_found = set()
     all_nodes = graph_first.nodes + graph_second.nodes
     all_descriptive_ids = [set(descriptive_id_recursive_nodes(node)) for node in graph_first.nodes] +\
                           [set(descriptive_id_recursive_nodes(node)) for node in graph_second.nodes]
     all_recursive_ids = dict(zip(all_nodes, all_descriptive_ids))
     for node_first in graph_first.nodes:
         for node_second in graph_second.nodes:
-            if (node_first, node_second) in pairs_list:
+            if (node_first, node_second) in pairs_found:
                 continue
             equivalent_pairs = structural_equivalent_nodes(node_first=node_first, node_second=node_second,
                                                            recursive_ids=all_recursive_ids)
-            pairs_list.extend(equivalent_pairs)
+            pairs_found.update(equivalent_pairs)
 
-    pairs_list = list(set(pairs_list))
+    pairs_list = list(pairs_found)
     if with_primary_nodes:
         return pairs_list
     # remove nodes with no children
@@ -55,38 +57,54 @@ def num_of_parents_in_crossover(num_of_final_inds: int) -> int:
 
 
 def filter_duplicates(archive, population) -> List[Any]:
+    population_fitness = [pop_ind.fitness for pop_ind in population]
+    population_values = _stack_fitness_values(population_fitness)
     filtered_archive = []
     for ind in archive.items:
-        has_duplicate_in_pop = False
-        for pop_ind in population:
-            if ind.fitness == pop_ind.fitness:
-                has_duplicate_in_pop = True
-                break
+        if population_values is not None and _is_same_kind_fitness(ind.fitness, population_fitness[0]):
+            # same tolerances as in Fitness.allclose used by the fitness equality
+            has_duplicate_in_pop = np.isclose(ind.fitness.values, population_values,
+                                              rtol=1e-8, atol=1e-10).all(axis=1).any()
+        else:
+            has_duplicate_in_pop = any(ind.fitness == pop_fitness for pop_fitness in population_fitness)
         if not has_duplicate_in_pop:
             filtered_archive.append(ind)
     return filtered_archive
 
 
+def _is_same_kind_fitness(fitness: Any, other: Any) -> bool:
+    """ Checks if fitness values can be compared as rows of one numeric array. """
+    return (type(fitness) is type(other) and fitness.valid and
+            len(fitness.values) == len(other.values) and None not in fitness.values)
+
+
+def _stack_fitness_values(fitnesses: Sequence[Any]) -> Optional[np.ndarray]:
+    """ Returns fitness values as 2d array if all of them are comparable, otherwise None. """
+    if not fitnesses or not all(_is_same_kind_fitness(fitness, fitnesses[0]) for fitness in fitnesses):
+        return None
+    return np.array([fitness.values for fitness in fitnesses], dtype=float)
+
+
 def structural_equivalent_nodes(node_first: Any,
                                 node_second: Any,
                                 recursive_ids: Optional[dict] = None,
-                                seen: Optional[List[Any]] = None) -> List[Tuple[Any, Any]]:
+                                seen: Optional[Set[Any]] = None) -> List[Tuple[Any, Any]]:
     """ Returns the list of nodes from which subtrees are structurally equivalent.
     :param node_first: node from first graph from which to start the search.
     :param node_second: node from second graph from which to start the search.
     :param recursive_ids: dict with recursive descriptive id of node with nodes as keys.
-    :param seen: list of already visited nodes to avoid infinite recursion.
+    :param seen: set of already visited nodes to avoid infinite recursion.
     Descriptive ids can be obtained with `descriptive_id_recursive_nodes`.
     """
 
     nodes = []
     is_same_type = type(node_first) == type(node_second)
-    seen = seen or []
+    seen = seen or set()
 
     if node_first in seen or node_second in seen:
         return []
-    seen.append(node_first)
-    seen.append(node_second)
+    seen.add(node_first)
+    seen.add(node_second)
     # check if both nodes are primary or secondary
     if hasattr(node_first, 'is_primary') and hasattr(node_second, 'is_primary'):
         is_same_graph_node_type = node_first.is_primary == node_second.is_primary
@@ -126,13 +126,15 @@ def single_edge_mutation(graph: OptGraph,
                 return False
         return True
 
-    for _ in range(parameters.max_num_of_operator_attempts):
-        if len(graph.nodes) < 2 or graph.depth > requirements.max_depth:
-            return graph
+    if len(graph.nodes) < 2 or graph.depth > requirements.max_depth:
+        return graph
 
+    # graph stays unchanged until an edge is added, so the check is done once
+    is_graph_cycled = graph_has_cycle(graph)
+    for _ in range(parameters.max_num_of_operator_attempts):
         source_node, target_node = sample(graph.nodes, 2)
         if source_node not in target_node.nodes_from:
-            if graph_has_cycle(graph):
+            if is_graph_cycled:
                 graph.connect_nodes(source_node, target_node)
                 break
             else:
@@ -319,9 +321,9 @@ def tree_growth(graph: OptGraph,
             is_primary_node_selected = (not node_from_graph.nodes_from) or (node_from_graph != graph.root_node and
                                                                             randint(0, 1))
         else:
-            max_depth = requirements.max_depth - distance_to_root_level(graph, node_from_graph)
-            is_primary_node_selected = \
-                distance_to_root_level(graph, node_from_graph) >= requirements.max_depth and randint(0, 1)
+            root_distance = distance_to_root_level(graph, node_from_graph)
+            max_depth = requirements.max_depth - root_distance
+            is_primary_node_selected = root_distance >= requirements.max_depth and randint(0, 1)
         if is_primary_node_selected:
             new_subtree = graph_gen_params.node_factory.get_node(is_primary=True)
             if not new_subtree:
@@ -240,8 +240,8 @@ def exchange_edges_crossover(graph_first: OptGraph, graph_second: OptGraph, max_
     for parent, child in choice_edges_2:
         child.nodes_from.remove(parent)
 
-    old_edges1 = graph_first.get_edges()
-    old_edges2 = graph_second.get_edges()
+    old_edges1 = set(graph_first.get_edges())
+    old_edges2 = set(graph_second.get_edges())
 
     new_edges_2 = find_edges_in_other_graph(choice_edges_1, graph_second)
     new_edges_1 = find_edges_in_other_graph(choice_edges_2, graph_first)
@@ -284,7 +284,7 @@ def exchange_parents_one_crossover(graph_first: OptGraph, graph_second: OptGraph
         node_from_first_graph = find_nodes_in_other_graph([selected_node], graph_first)[0]
 
         node_from_first_graph.nodes_from = []
-        old_edges1 = graph_first.get_edges()
+        old_edges1 = set(graph_first.get_edges())
 
         if parents:
             parents_in_first_graph = find_nodes_in_other_graph(parents, graph_first)
@@ -335,8 +335,8 @@ def exchange_parents_both_crossover(graph_first: OptGraph, graph_second: OptGrap
         for p in parents2:
             selected_node2.nodes_from.remove(p)
 
-        old_edges1 = graph_first.get_edges()
-        old_edges2 = graph_second.get_edges()
+        old_edges1 = set(graph_first.get_edges())
+        old_edges2 = set(graph_second.get_edges())
 
         for parent in parents_in_first_graph:
             if (parent, selected_node1) not in old_edges1:
@@ -8,6 +8,8 @@ import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union, TYPE_CHECKING
 
+import numpy as np
+
 from golem.core.log import default_log
 from golem.core.optimisers.objective.objective import ObjectiveInfo
 from golem.core.optimisers.opt_history_objects.generation import Generation
@@ -38,6 +40,7 @@ class OptHistory:
         self._generations: List[Generation] = []
         self.archive_history: List[List[Individual]] = []
         self._tuning_result: Optional[Graph] = None
+        self._fitness_array: Optional[np.ndarray] = None
 
         # init default save directory
         if default_save_dir:
@@ -142,6 +145,18 @@ class OptHistory:
                                   for pop in self.generations]
         return historical_fitness
 
+    @property
+    def fitness_array(self) -> np.ndarray:
+        """Return fitness values of all generations as array indexed by [generation, individual, metric].
+        Generations of smaller size and missing fitness values are padded with nan-s.
+        The array is built once and is rebuilt only when the number of generations changes."""
+        # histories loaded from json don't have the attribute
+        fitness_array = getattr(self, '_fitness_array', None)
+        if fitness_array is None or len(fitness_array) != self.generations_count:
+            fitness_array = populations_to_fitness_array(self.generations)
+            self._fitness_array = fitness_array
+        return fitness_array
+
     @property
     def all_historical_fitness(self) -> List[float]:
         historical_fitness = self.historical_fitness
@@ -196,9 +211,17 @@ class OptHistory:
         Prints ordered description of the best solutions in history
         :param top_n: number of solutions to print
         """
+        # Individuals are kept between generations, so descriptive id is computed once per individual
+        descriptive_ids = {}
+
+        def get_descriptive_id(individual: Individual) -> str:
+            if individual.uid not in descriptive_ids:
+                descriptive_ids[individual.uid] = individual.graph.descriptive_id
+            return descriptive_ids[individual.uid]
+
         # Take only the first graph's appearance in history
         individuals_with_positions \
-            = list({ind.graph.descriptive_id: (ind, gen_num, ind_num)
+            = list({get_descriptive_id(ind): (ind, gen_num, ind_num)
                     for gen_num, gen in enumerate(self.generations)
                     for ind_num, ind in reversed(list(enumerate(gen)))}.values())
 
@@ -215,7 +238,7 @@ class OptHistory:
             print(separator.join([f'{ind_num:>3}, '
                                   f'{str(individual.fitness):>8}, '
                                   f'{positional_id:>8}, '
-                                  f'{individual.graph.descriptive_id}']), file=output)
+                                  f'{get_descriptive_id(individual)}']), file=output)
 
         # add info about initial assumptions (stored as zero generation)
         for i, individual in enumerate(self.generations[0]):
@@ -224,7 +247,7 @@ class OptHistory:
             print(separator.join([f'{ind:>3}'
                                   f'{str(individual.fitness):>8}',
                                   f'{positional_id}',
-                                  f'{individual.graph.descriptive_id}']), file=output)
+                                  f'{get_descriptive_id(individual)}']), file=output)
         return output.getvalue()
 
     @property
@@ -265,6 +288,7 @@ class OptHistory:
     @generations.setter
     def generations(self, value):
         self._generations = value
+        self._fitness_array = None
 
     @property
     def individuals(self):
@@ -282,6 +306,19 @@ class OptHistory:
         return default_log(self)
 
 
+def populations_to_fitness_array(populations: Sequence[Sequence[Individual]]) -> np.ndarray:
+    """Returns fitness values of populations as array indexed by [population, individual, metric].
+    Populations of smaller size are padded with nan-s, as well as None values of fitness."""
+    fitness_values = [np.array([ind.fitness.values for ind in pop], dtype=float) for pop in populations]
+    max_pop_size = max((len(pop_values) for pop_values in fitness_values), default=0)
+    num_metrics = max((pop_values.shape[-1] for pop_values in fitness_values if pop_values.size), default=0)
+    fitness_array = np.full((len(fitness_values), max_pop_size, num_metrics), np.nan)
+    for i, pop_values in enumerate(fitness_values):
+        if pop_values.size:
+            fitness_array[i, :len(pop_values)] = pop_values
+    return fitness_array
+
+
 def lighten_history(history: OptHistory) -> OptHistory:
     """ Keeps the most informative field in OptHistory object to show most of the visualizations
     without excessive memory usage. """
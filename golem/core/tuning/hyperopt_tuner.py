@@ -126,15 +126,10 @@ def get_parameter_hyperopt_space(search_space: SearchSpace,
         parameter range
     """
 
-    # Get available parameters for current operation
-    operation_parameters = search_space.parameters_per_operation.get(operation_name)
-
-    if operation_parameters is not None:
-        parameter_properties = operation_parameters.get(parameter_name)
-        hyperopt_distribution = parameter_properties.get('hyperopt-dist')
-        sampling_scope = parameter_properties.get('sampling-scope')
-        if hyperopt_distribution == hp.loguniform:
-            sampling_scope = [np.log(x) for x in sampling_scope]
+    hyperopt_space = search_space.get_hyperopt_space(operation_name, parameter_name)
+
+    if hyperopt_space is not None:
+        hyperopt_distribution, sampling_scope = hyperopt_space
         return hyperopt_distribution(label, *sampling_scope)
     else:
         return None
@@ -237,26 +237,18 @@ def get_node_parameters_for_iopt(search_space: SearchSpace, node_id: int, operat
         discrete_parameters_dict: dictionary-like structure with labeled discrete hyperparameters
         and their range per operation
     """
-    # Get available parameters for operation
-    parameters_dict = search_space.parameters_per_operation.get(operation_name, {})
-
-    discrete_parameters_dict = {}
-    float_parameters_dict = {}
-    categorical_parameters_dict = {}
-
-    for parameter_name, parameter_properties in parameters_dict.items():
-        node_op_parameter_name = get_node_operation_parameter_label(node_id, operation_name, parameter_name)
-
-        parameter_type = parameter_properties.get('type')
-        if parameter_type == 'discrete':
-            discrete_parameters_dict.update({node_op_parameter_name: list(range(*parameter_properties
-                                                                                .get('sampling-scope')))})
-        elif parameter_type == 'continuous':
-            float_parameters_dict.update({node_op_parameter_name: parameter_properties
-                                         .get('sampling-scope')})
-        elif parameter_type == 'categorical':
-            categorical_parameters_dict.update({node_op_parameter_name: parameter_properties
-                                               .get('sampling-scope')[0]})
+    discrete_parameters_dict = {
+        get_node_operation_parameter_label(node_id, operation_name, parameter_name): list(range(*sampling_scope))
+        for parameter_name, sampling_scope in search_space.get_parameters_of_type(operation_name, 'discrete').items()
+    }
+    float_parameters_dict = {
+        get_node_operation_parameter_label(node_id, operation_name, parameter_name): sampling_scope
+        for parameter_name, sampling_scope in search_space.get_parameters_of_type(operation_name, 'continuous').items()
+    }
+    categorical_parameters_dict = {
+        get_node_operation_parameter_label(node_id, operation_name, parameter_name): sampling_scope[0]
+        for parameter_name, sampling_scope in search_space.get_parameters_of_type(operation_name, 'categorical').items()
+    }
 
     # IOpt does not distinguish between discrete and categorical parameters
     discrete_parameters_dict = {**discrete_parameters_dict, **categorical_parameters_dict}
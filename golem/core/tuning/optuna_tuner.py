@@ -13,6 +13,7 @@ from golem.core.optimisers.objective import ObjectiveFunction
 from golem.core.tuning.search_space import SearchSpace, get_node_operation_parameter_label
 from golem.core.tuning.tuner_interface import BaseTuner, DomainGraphForTune
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
+from golem.utilities.utilities import determine_n_jobs
 
 
 class OptunaTuner(BaseTuner):
@@ -81,7 +82,11 @@ class OptunaTuner(BaseTuner):
     def objective(self, trial: Trial, graph: OptGraph) -> Union[float, Sequence[float, ]]:
         new_parameters = self._get_parameters_from_trial(graph, trial)
         new_graph = BaseTuner.set_arg_graph(graph, new_parameters)
-        metric_value = self.get_metric_value(new_graph)
+        if determine_n_jobs(self.n_jobs) > 1:
+            # parallel trials change parameters of the same graph, so its id can't be used as a cache key
+            metric_value = self._evaluate_metric_value(new_graph)
+        else:
+            metric_value = self.get_metric_value(new_graph)
         return metric_value
 
     def _get_parameters_from_trial(self, graph: OptGraph, trial: Trial) -> dict:
@@ -126,10 +131,7 @@ class OptunaTuner(BaseTuner):
         return initial_parameters, has_parameters_to_optimize
 
     def early_stopping_callback(self, study: Study, trial: FrozenTrial):
-        if self.early_stopping_rounds is not None:
-            current_trial_number = trial.number
-            best_trial_number = study.best_trial.number
-            should_stop = (current_trial_number - best_trial_number) >= self.early_stopping_rounds
-            if should_stop:
-                self.log.debug('Early stopping rounds criteria was reached')
-                study.stop()
+        self._early_stopping.update(trial.value)
+        if self._early_stopping.should_stop:
+            self.log.debug('Early stopping rounds criteria was reached')
+            study.stop()
@@ -1,4 +1,8 @@
-from typing import Dict, Callable, List, Union
+from functools import lru_cache
+from typing import Dict, Callable, List, Optional, Tuple, Union
+
+import numpy as np
+from hyperopt import hp
 
 OperationParametersMapping = Dict[str, Dict[str, Dict[str, Union[Callable, List, str]]]]
 
@@ -24,19 +28,40 @@ class SearchSpace:
 
     def __init__(self, search_space: OperationParametersMapping):
         self.parameters_per_operation = search_space
+        # distributions and sampling scopes are prepared once instead of on every tuner start
+        self._hyperopt_spaces: Dict[Tuple[str, str], Tuple[Callable, List]] = {}
+        self._parameters_per_type: Dict[str, Dict[str, Dict[str, List]]] = {}
+        for operation_name, operation_parameters in search_space.items():
+            parameters_per_type = {}
+            for parameter_name, parameter_properties in operation_parameters.items():
+                hyperopt_distribution = parameter_properties.get('hyperopt-dist')
+                sampling_scope = parameter_properties.get('sampling-scope')
+                if hyperopt_distribution == hp.loguniform:
+                    sampling_scope = [np.log(x) for x in sampling_scope]
+                self._hyperopt_spaces[operation_name, parameter_name] = (hyperopt_distribution, sampling_scope)
+
+                parameter_type = parameter_properties.get('type')
+                parameters_per_type.setdefault(parameter_type, {})[parameter_name] = \
+                    parameter_properties.get('sampling-scope')
+            self._parameters_per_type[operation_name] = parameters_per_type
 
     def get_parameters_for_operation(self, operation_name: str) -> List[str]:
         parameters_list = list(self.parameters_per_operation.get(operation_name, {}).keys())
         return parameters_list
 
+    def get_hyperopt_space(self, operation_name: str, parameter_name: str) -> Optional[Tuple[Callable, List]]:
+        """ Returns hyperopt distribution and its arguments (log-scaled for ``hp.loguniform``) """
+        return self._hyperopt_spaces.get((operation_name, parameter_name))
 
-def get_node_operation_parameter_label(node_id: int, operation_name: str, parameter_name: str) -> str:
-    # Name with operation and parameter
-    op_parameter_name = ''.join((operation_name, ' | ', parameter_name))
+    def get_parameters_of_type(self, operation_name: str, parameter_type: str) -> Dict[str, List]:
+        """ Returns sampling scopes of the operation parameters having the given type """
+        return self._parameters_per_type.get(operation_name, {}).get(parameter_type, {})
 
+
+@lru_cache(maxsize=4096)
+def get_node_operation_parameter_label(node_id: int, operation_name: str, parameter_name: str) -> str:
     # Name with node id || operation | parameter
-    node_op_parameter_name = ''.join((str(node_id), ' || ', op_parameter_name))
-    return node_op_parameter_name
+    return f'{node_id} || {operation_name} | {parameter_name}'
 
 
 def convert_parameters(parameters):
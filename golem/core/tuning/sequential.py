@@ -64,7 +64,7 @@ class SequentialTuner(HyperoptTuner):
 
             # Tuning performed sequentially for every node - so get ids of nodes
             nodes_ids = self.get_nodes_order(nodes_number=nodes_amount)
-            final_graph = deepcopy(self.init_graph)
+            final_graph = self._copy_init_graph()
             best_metric = self.init_metric
             for node_id in nodes_ids:
                 node = graph.nodes[node_id]
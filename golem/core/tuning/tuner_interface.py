@@ -1,25 +1,62 @@
+import pickle
 from abc import abstractmethod
+from collections import defaultdict
 from copy import deepcopy
 from datetime import timedelta
-from typing import TypeVar, Generic, Optional, Union, Sequence
+from typing import TypeVar, Generic, Optional, Union, Sequence, Dict, List
 
 import numpy as np
+from joblib import Parallel, delayed
 
 from golem.core.adapter import BaseOptimizationAdapter
 from golem.core.adapter.adapter import IdentityAdapter
 from golem.core.constants import MAX_TUNING_METRIC_VALUE, MIN_TIME_FOR_TUNING_IN_SEC
 from golem.core.dag.graph_utils import graph_structure
-from golem.core.log import default_log
-from golem.core.optimisers.fitness import SingleObjFitness, MultiObjFitness
+from golem.core.log import default_log, MESSAGE_LEVEL
+from golem.core.optimisers.fitness import Fitness, MultiObjFitness
 from golem.core.optimisers.graph import OptGraph
 from golem.core.optimisers.objective import ObjectiveEvaluate, ObjectiveFunction
 from golem.core.optimisers.timer import Timer
 from golem.core.tuning.search_space import SearchSpace, convert_parameters
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
+from golem.utilities.utilities import determine_n_jobs
 
 DomainGraphForTune = TypeVar('DomainGraphForTune')
 
 
+class EarlyStoppingMonitor:
+    """
+    Detects stagnation of tuning for early stopping. Tuning stagnates if the best (minimal) metric value
+    has not improved by more than ``min_delta`` for ``rounds`` consecutive evaluations.
+
+    Args:
+      rounds: max number of stagnating evaluations. If ``None``, tuning never stagnates.
+      min_delta: minimal decrease of the best metric value that is counted as an improvement.
+    """
+
+    def __init__(self, rounds: Optional[int], min_delta: float = 0.):
+        self.rounds = rounds
+        self.min_delta = min_delta
+        self._best_metric = None
+        self._stagnation_rounds = 0
+
+    def reset(self):
+        self._best_metric = None
+        self._stagnation_rounds = 0
+
+    def update(self, metric: Optional[float]):
+        """ Registers metric value of the next evaluation. ``None`` means failed evaluation. """
+        if metric is not None and (self._best_metric is None or metric < self._best_metric - self.min_delta):
+            self._best_metric = metric
+            self._stagnation_rounds = 0
+        else:
+            self._stagnation_rounds += 1
+
+    @property
+    def should_stop(self) -> bool:
+        return self.rounds is not None and self._stagnation_rounds >= self.rounds
+
+
 class BaseTuner(Generic[DomainGraphForTune]):
     """
     Base class for hyperparameters optimization
@@ -35,6 +72,9 @@ class BaseTuner(Generic[DomainGraphForTune]):
       deviation: required improvement (in percent) of a metric to return tuned graph.
         By default, ``deviation=0.05``, which means that tuned graph will be returned
         if it's metric will be at least 0.05% better than the initial.
+      cache_metrics: if ``True``, metric values are memoized by graph descriptive id during a tuning run,
+        so graphs with the same structure and parameters are evaluated once.
+        Suitable only for deterministic objectives, disabled by default.
     """
 
     def __init__(self, objective_evaluate: ObjectiveFunction,
@@ -44,7 +84,8 @@ class BaseTuner(Generic[DomainGraphForTune]):
                  early_stopping_rounds: Optional[int] = None,
                  timeout: timedelta = timedelta(minutes=5),
                  n_jobs: int = -1,
-                 deviation: float = 0.05, **kwargs):
+                 deviation: float = 0.05,
+                 cache_metrics: bool = False, **kwargs):
         self.iterations = iterations
         self.adapter = adapter or IdentityAdapter()
         self.search_space = search_space
@@ -57,14 +98,20 @@ class BaseTuner(Generic[DomainGraphForTune]):
         self.timeout = timeout
         self.timer = Timer()
         self.early_stopping_rounds = early_stopping_rounds
+        self._early_stopping = EarlyStoppingMonitor(early_stopping_rounds)
 
         self._default_metric_value = MAX_TUNING_METRIC_VALUE
         self.was_tuned = False
-        self.init_graph = None
+        self._init_graph = None
+        self._init_graph_dump: Optional[bytes] = None
+        self._init_graph_structure: Optional[str] = None
         self.init_metric = None
         self.obtained_metric = None
         self.log = default_log(self)
         self.objectives_number = 1
+        self.cache_metrics = cache_metrics
+        # metric values of already evaluated graphs by their descriptive ids (if caching is enabled)
+        self._metric_cache: Dict[str, Union[float, Sequence[float]]] = {}
 
     def tune(self, graph: DomainGraphForTune, **kwargs) -> Union[DomainGraphForTune, Sequence[DomainGraphForTune]]:
         """
@@ -103,14 +150,52 @@ class BaseTuner(Generic[DomainGraphForTune]):
           multi_obj: If optimization was multi objective.
         """
         self.log.info('Hyperparameters optimization start: estimation of metric for initial graph')
-
-        # Train graph
-        self.init_graph = deepcopy(graph)
-
-        self.init_metric = self.get_metric_value(graph=self.init_graph)
-        self.log.message(f'Initial graph: {graph_structure(self.init_graph)} \n'
-                         f'Initial metric: '
-                         f'{list(map(lambda x: round(abs(x), 3), ensure_wrapped_in_sequence(self.init_metric)))}')
+        self._metric_cache.clear()
+        self._early_stopping.reset()
+
+        # Graph is tuned inplace, so its initial state is stored.
+        # It is only restored if it is needed, e.g. if the tuned graph is worse than the initial one
+        self._init_graph = None
+        self._init_graph_dump = None
+        self._init_graph_structure = None
+        try:
+            self._init_graph_dump = pickle.dumps(graph)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # graph content can't be pickled (e.g. lambdas or open handles in parameters)
+            self._init_graph = deepcopy(graph)
+
+        self.init_metric = self.get_metric_value(graph=graph)
+        # graph structure is formatted only if the message is going to be logged
+        if self.log.isEnabledFor(MESSAGE_LEVEL):
+            self._init_graph_structure = graph_structure(graph)
+            self.log.message(f'Initial graph: {self._init_graph_structure} \n'
+                             f'Initial metric: '
+                             f'{list(map(lambda x: round(abs(x), 3), ensure_wrapped_in_sequence(self.init_metric)))}')
+
+    @property
+    def init_graph(self) -> Optional[OptGraph]:
+        """ Graph in the state before tuning """
+        if self._init_graph is None and self._init_graph_dump is not None:
+            self._init_graph = self._copy_init_graph()
+        return self._init_graph
+
+    @init_graph.setter
+    def init_graph(self, graph: Optional[OptGraph]):
+        self._init_graph = graph
+        self._init_graph_dump = None
+        self._init_graph_structure = None
+
+    def _copy_init_graph(self) -> OptGraph:
+        """ Returns a new copy of the graph in the state before tuning """
+        if self._init_graph_dump is not None:
+            return pickle.loads(self._init_graph_dump)
+        return deepcopy(self._init_graph)
+
+    def _get_graph_structure(self, graph: OptGraph) -> str:
+        """ Returns graph structure reusing the one of the initial graph if it is the initial graph """
+        if graph is self._init_graph and self._init_graph_structure is not None:
+            return self._init_graph_structure
+        return graph_structure(graph)
 
     def final_check(self, tuned_graphs: Union[OptGraph, Sequence[OptGraph]], multi_obj: bool = False) \
             -> Union[OptGraph, Sequence[OptGraph]]:
@@ -137,9 +222,15 @@ class BaseTuner(Generic[DomainGraphForTune]):
         if np.isclose(self.obtained_metric, self._default_metric_value):
             self.obtained_metric = None
 
-        # 0.05% deviation is acceptable
-        deviation_value = (self.init_metric / 100.0) * self.deviation
-        init_metric = self.init_metric + deviation_value * (-np.sign(self.init_metric))
+        if self.obtained_metric is not None and np.isclose(self.init_metric, self._default_metric_value):
+            # initial graph failed to evaluate, so any successfully evaluated graph is better
+            self.log.message(f'Initial metric is invalid. '
+                             f'Return tuned graph with metric {abs(self.obtained_metric):.3f}')
+            return tuned_graph
+
+        # 0.05% deviation is acceptable. Deviation is always towards better (lower) values,
+        # since sign(x) * x == abs(x), no sign computation is needed
+        init_metric = self.init_metric - (abs(self.init_metric) / 100.0) * self.deviation
         if self.obtained_metric is None:
             self.log.info(f'{prefix_init_phrase} is None. Initial metric is {abs(init_metric):.3f}')
             final_graph = self.init_graph
@@ -155,7 +246,8 @@ class BaseTuner(Generic[DomainGraphForTune]):
             final_graph = self.init_graph
             final_metric = self.init_metric
             self.obtained_metric = final_metric
-        self.log.message(f'Final graph: {graph_structure(final_graph)}')
+        if self.log.isEnabledFor(MESSAGE_LEVEL):
+            self.log.message(f'Final graph: {self._get_graph_structure(final_graph)}')
         if final_metric is not None:
             self.log.message(f'Final metric: {abs(final_metric):.3f}')
         else:
@@ -165,11 +257,10 @@ class BaseTuner(Generic[DomainGraphForTune]):
     def _multi_obj_final_check(self, tuned_graphs: Sequence[OptGraph]) -> Sequence[OptGraph]:
         self.obtained_metric = []
         final_graphs = []
-        for tuned_graph in tuned_graphs:
-            obtained_metric = self.get_metric_value(graph=tuned_graph)
-            for e, value in enumerate(obtained_metric):
-                if np.isclose(value, self._default_metric_value):
-                    obtained_metric[e] = None
+        for tuned_graph, obtained_metric in zip(tuned_graphs, self.get_metric_values(tuned_graphs)):
+            # metric values are immutable tuples shared with the cache, so a new list is built
+            obtained_metric = [None if np.isclose(value, self._default_metric_value) else value
+                               for value in obtained_metric]
             if not MultiObjFitness(self.init_metric).dominates(MultiObjFitness(obtained_metric)):
                 self.obtained_metric.append(obtained_metric)
                 final_graphs.append(tuned_graph)
@@ -194,20 +285,67 @@ class BaseTuner(Generic[DomainGraphForTune]):
         Returns:
           value of loss function
         """
-        graph_fitness = self.objective_evaluate(graph)
+        if not self.cache_metrics:
+            return self._evaluate_metric_value(graph)
 
-        if isinstance(graph_fitness, SingleObjFitness):
-            metric_value = graph_fitness.value
-            if not graph_fitness.valid:
-                return self._default_metric_value
-            return metric_value
+        # graphs with the same structure and parameters are evaluated only once during tuning
+        graph_id = graph.descriptive_id
+        cached_value = self._metric_cache.get(graph_id)
+        if cached_value is not None:
+            return cached_value
 
-        elif isinstance(graph_fitness, MultiObjFitness):
-            metric_values = graph_fitness.values
-            for e, value in enumerate(metric_values):
-                if value is None:
-                    metric_values[e] = self._default_metric_value
-            return metric_values
+        return self._fitness_to_metric_value(self.objective_evaluate(graph), graph_id)
+
+    def get_metric_values(self, graphs: Sequence[OptGraph],
+                          parallel: bool = False) -> List[Union[float, Sequence[float]]]:
+        """
+        Method calculates metrics for a batch of graphs. Already evaluated graphs are skipped
+        if ``cache_metrics`` is enabled
+
+        Args:
+          graphs: Graphs to evaluate
+          parallel: whether to evaluate graphs in separate processes according to ``n_jobs``.
+            Requires objective and graphs to be picklable, changes made by the objective
+            to the graphs are not propagated back
+
+        Returns:
+          values of loss function in the order of passed graphs
+        """
+        if self.cache_metrics:
+            graph_ids = [graph.descriptive_id for graph in graphs]
+            graphs_to_evaluate = {}
+            for graph_id, graph in zip(graph_ids, graphs):
+                if self._metric_cache.get(graph_id) is None and graph_id not in graphs_to_evaluate:
+                    graphs_to_evaluate[graph_id] = graph
+        else:
+            # every graph is evaluated
+            graph_ids = list(range(len(graphs)))
+            graphs_to_evaluate = dict(zip(graph_ids, graphs))
+
+        n_jobs = min(determine_n_jobs(self.n_jobs), len(graphs_to_evaluate)) if parallel else 1
+        if n_jobs > 1:
+            fitnesses = Parallel(n_jobs=n_jobs)(delayed(self.objective_evaluate)(graph)
+                                                for graph in graphs_to_evaluate.values())
+        else:
+            fitnesses = [self.objective_evaluate(graph) for graph in graphs_to_evaluate.values()]
+
+        evaluated_values = {graph_id: self._fitness_to_metric_value(fitness, graph_id if self.cache_metrics else None)
+                            for graph_id, fitness in zip(graphs_to_evaluate, fitnesses)}
+        return [evaluated_values[graph_id] if graph_id in evaluated_values else self._metric_cache[graph_id]
+                for graph_id in graph_ids]
+
+    def _evaluate_metric_value(self, graph: OptGraph) -> Union[float, Sequence[float]]:
+        """ Calculates metric of the graph bypassing the metric cache """
+        return self._fitness_to_metric_value(self.objective_evaluate(graph))
+
+    def _fitness_to_metric_value(self, graph_fitness: Fitness,
+                                 graph_id: Optional[str] = None) -> Union[float, Sequence[float]]:
+        """ Converts fitness of the graph to metric value and caches it by ``graph_id`` if it is provided
+        and the evaluation succeeded """
+        metric_value = graph_fitness.to_metric(self._default_metric_value)
+        if graph_id is not None and graph_fitness.valid:
+            self._metric_cache[graph_id] = metric_value
+        return metric_value
 
     @staticmethod
     def set_arg_graph(graph: OptGraph, parameters: dict) -> OptGraph:
@@ -220,13 +358,18 @@ class BaseTuner(Generic[DomainGraphForTune]):
         Returns:
             graph: graph with new hyperparameters in each node
         """
+        # Group labeled parameters by node ids to avoid scanning all parameters for every node
+        parameters_per_node = defaultdict(dict)
+        for key, value in parameters.items():
+            node_id, _, _ = key.partition(' || ')
+            parameters_per_node[node_id][key] = value
+
         # Set hyperparameters for every node
         for node_id, node in enumerate(graph.nodes):
-            node_params = {key: value for key, value in parameters.items()
-                           if key.startswith(f'{str(node_id)} || {node.name}')}
-
-            if node_params is not None:
-                BaseTuner.set_arg_node(graph, node_id, node_params)
+            label_prefix = f'{node_id} || {node.name}'
+            node_params = {key: value for key, value in parameters_per_node.get(str(node_id), {}).items()
+                           if key.startswith(label_prefix)}
+            BaseTuner.set_arg_node(graph, node_id, node_params)
 
         return graph
 
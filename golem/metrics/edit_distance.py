@@ -1,6 +1,6 @@
 from datetime import timedelta, datetime
 from itertools import zip_longest
-from typing import Optional, Callable, Dict, Sequence
+from typing import Optional, Callable, Sequence
 
 import networkx as nx
 import numpy as np
@@ -58,17 +58,14 @@ def get_edit_dist_metric(target_graph: nx.DiGraph,
                          upper_bound: Optional[int] = None,
                          requirements: Optional[GraphRequirements] = None,
                          ) -> Callable[[nx.DiGraph], float]:
-    def node_match(node_content_1: Dict, node_content_2: Dict) -> bool:
-        operations_do_match = node_content_1.get('name') == node_content_2.get('name')
-        return True or operations_do_match
-
     if requirements:
-        upper_bound = upper_bound or int(np.sqrt(requirements.max_depth * requirements.max_arity)),
+        upper_bound = upper_bound or int(np.sqrt(requirements.max_depth * requirements.max_arity))
         timeout = timeout or requirements.max_graph_fit_time
 
     def metric(graph: nx.DiGraph) -> float:
+        # nodes are not matched by their names, so node_match is omitted to avoid
+        # calling it for each pair of nodes during edit paths search
         ged = graph_edit_distance(target_graph, graph,
-                                  node_match=node_match,
                                   upper_bound=upper_bound,
                                   timeout=timeout.total_seconds() if timeout else None,
                                   )
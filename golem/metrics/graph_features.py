@@ -1,38 +1,51 @@
-from typing import Callable, Sequence, Tuple
+from typing import Callable, List, Sequence, Tuple
 
 import networkx as nx
 import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse as sps
 
 from golem.metrics import mmd
 from golem.metrics.mmd import compute_mmd
+from golem.utilities.utilities import determine_n_jobs
+
+# Minimal number of graphs for which statistics are computed in parallel
+MIN_PARALLEL_STATS_SAMPLES = 8
+# Number of histogram bins for clustering coefficients
+CLUSTERING_BINS = 100
 
 
 def compute_all_stats(graph_prediction: Sequence[nx.Graph],
                       graph_target: Sequence[nx.Graph]) -> Tuple[float, float]:
-    mmd_degree = degree_stats(graph_prediction, graph_target)
-    mmd_clustering = clustering_stats(graph_prediction, graph_target)
+    # degree and clustering statistics are computed in one pass over each graph
+    degree_predict, clustering_predict = _split_stats(_degree_clustering_stats_graph, graph_prediction)
+    degree_target, clustering_target = _split_stats(_degree_clustering_stats_graph, graph_target)
 
+    mmd_degree = compute_mmd(degree_target, degree_predict, normalize=True)
+    mmd_clustering = compute_mmd(clustering_target, clustering_predict,
+                                 sigma=0.1, distance_scaling=CLUSTERING_BINS, normalize=False)
     return mmd_degree, mmd_clustering
 
 
 def degree_stats(graph_prediction: Sequence[nx.Graph],
-                 graph_target: Sequence[nx.Graph]) -> float:
-    return mmd_stats(nx.degree_histogram, graph_prediction, graph_target, normalize=True)
+                 graph_target: Sequence[nx.Graph],
+                 n_jobs: int = 1) -> float:
+    return mmd_stats(nx.degree_histogram, graph_prediction, graph_target, n_jobs=n_jobs, normalize=True)
 
 
 def clustering_stats(graph_prediction: Sequence[nx.Graph],
-                     graph_target: Sequence[nx.Graph]) -> float:
-    bins = 100
-    return mmd_stats(clustering_stats_graph, graph_prediction, graph_target,
-                     sigma=0.1, distance_scaling=bins, normalize=False)
+                     graph_target: Sequence[nx.Graph],
+                     n_jobs: int = 1) -> float:
+    return mmd_stats(clustering_stats_graph, graph_prediction, graph_target, n_jobs=n_jobs,
+                     sigma=0.1, distance_scaling=CLUSTERING_BINS, normalize=False)
 
 
 def mmd_stats(stat_function: Callable[[nx.Graph], np.ndarray],
               graph_prediction: Sequence[nx.Graph],
               graph_target: Sequence[nx.Graph],
+              n_jobs: int = 1,
               **kwargs):
-    sample_predict = list(map(stat_function, graph_prediction))
-    sample_target = list(map(stat_function, graph_target))
+    sample_predict, sample_target = _collect_stats(stat_function, graph_prediction, graph_target, n_jobs)
     return compute_mmd(sample_target, sample_predict, **kwargs)
 
 
@@ -42,10 +55,10 @@ def mmd_stats_impl(stat_function: Callable[[nx.Graph], np.ndarray],
                    kernel: Callable = mmd.gaussian_emd,
                    sigma: float = 1.0,
                    distance_scaling: float = 1.0,
-                   normalize: bool = False) -> float:
+                   normalize: bool = False,
+                   n_jobs: int = 1) -> float:
 
-    sample_predict = list(map(stat_function, graph_prediction))
-    sample_target = list(map(stat_function, graph_target))
+    sample_predict, sample_target = _collect_stats(stat_function, graph_prediction, graph_target, n_jobs)
 
     mmd_dist = compute_mmd(sample_target, sample_predict,
                            normalize=normalize, kernel=kernel,
@@ -53,7 +66,75 @@ def mmd_stats_impl(stat_function: Callable[[nx.Graph], np.ndarray],
     return mmd_dist
 
 
-def clustering_stats_graph(graph: nx.Graph, bins: int = 100) -> np.ndarray:
-    clustering_coeffs = list(nx.clustering(graph).values())
+def _collect_stats(stat_function: Callable[[nx.Graph], np.ndarray],
+                   graph_prediction: Sequence[nx.Graph],
+                   graph_target: Sequence[nx.Graph],
+                   n_jobs: int = 1) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """Computes statistics for both sequences of graphs,
+    in parallel if there are enough graphs to compensate the overhead."""
+    graphs = list(graph_prediction) + list(graph_target)
+    if n_jobs == 1 or len(graphs) < MIN_PARALLEL_STATS_SAMPLES:
+        samples = list(map(stat_function, graphs))
+    else:
+        samples = Parallel(n_jobs=determine_n_jobs(n_jobs))(delayed(stat_function)(graph) for graph in graphs)
+    num_predicted = len(graph_prediction)
+    return samples[:num_predicted], samples[num_predicted:]
+
+
+def clustering_stats_graph(graph: nx.Graph, bins: int = CLUSTERING_BINS) -> np.ndarray:
+    clustering_coeffs = clustering_coefficients(graph)
     hist, _ = np.histogram(clustering_coeffs, bins=bins, range=(0.0, 1.0), density=True)
     return hist
+
+
+def _degree_clustering_stats_graph(graph: nx.Graph,
+                                   bins: int = CLUSTERING_BINS) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes degree histogram (the same as ``nx.degree_histogram``) and
+    histogram of clustering coefficients from the single adjacency matrix."""
+    adj = nx.to_scipy_sparse_array(graph, weight=None, format='csr')
+    # self-loops are counted twice in node degree
+    degrees = np.asarray(adj.sum(axis=0)).ravel() + np.asarray(adj.sum(axis=1)).ravel() \
+        if graph.is_directed() else np.asarray(adj.sum(axis=1)).ravel() + adj.diagonal()
+    degree_hist = np.bincount(degrees.astype(int))
+
+    clustering_coeffs = _clustering_coefficients(adj, graph.is_directed())
+    clustering_hist, _ = np.histogram(clustering_coeffs, bins=bins, range=(0.0, 1.0), density=True)
+    return degree_hist, clustering_hist
+
+
+def _split_stats(stat_function: Callable[[nx.Graph], Tuple[np.ndarray, ...]],
+                 graphs: Sequence[nx.Graph]) -> Tuple[List[np.ndarray], ...]:
+    """Transforms sequence of statistics tuples computed on graphs to the tuple of samples."""
+    return tuple(map(list, zip(*map(stat_function, graphs))))
+
+
+def clustering_coefficients(graph: nx.Graph) -> np.ndarray:
+    """Computes unweighted clustering coefficients of graph nodes
+    (the same as ``nx.clustering(graph)`` for simple graphs)
+    using sparse matrix products instead of per-node triangle enumeration."""
+    adj = nx.to_scipy_sparse_array(graph, weight=None, format='csr')
+    return _clustering_coefficients(adj, graph.is_directed())
+
+
+def _clustering_coefficients(adj: sps.csr_array, directed: bool) -> np.ndarray:
+    # ignore self-loops and multiple edges like networkx does
+    adj = (adj - sps.diags(adj.diagonal())).tocsr()
+    adj.eliminate_zeros()
+    adj.data[:] = 1.
+
+    if directed:
+        # directed clustering by Fagiolo (2007)
+        sym_adj = adj + adj.T
+        triangles = (sym_adj @ sym_adj).multiply(sym_adj.T).sum(axis=1)
+        degrees_total = np.asarray(sym_adj.sum(axis=1)).ravel()
+        degrees_reciprocal = np.asarray(adj.multiply(adj.T).sum(axis=1)).ravel()
+        possible = 2 * (degrees_total * (degrees_total - 1) - 2 * degrees_reciprocal)
+    else:
+        triangles = (adj @ adj).multiply(adj).sum(axis=1)
+        degrees = np.asarray(adj.sum(axis=1)).ravel()
+        possible = degrees * (degrees - 1)
+    triangles = np.asarray(triangles, dtype=float).ravel()
+
+    coeffs = np.zeros_like(triangles)
+    np.divide(triangles, possible, out=coeffs, where=(triangles > 0) & (possible > 0))
+    return coeffs
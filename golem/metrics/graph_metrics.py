@@ -1,12 +1,19 @@
-from typing import Sequence
+from collections import OrderedDict
+from functools import partial
+from typing import Sequence, Callable, Optional, Union
 
 import networkx as nx
 import numpy as np
+from scipy import linalg as sla
+from scipy import sparse as sps
+from scipy.sparse import linalg as spla
 
 from golem.metrics.graph_features import degree_stats
-from libs.netcomp import _eigs, normalized_laplacian_eig
 from libs.netcomp import laplacian_matrix
 
+# Minimal size of the matrix for which truncated sparse eigensolver is used
+MIN_TRUNCATED_SPECTRUM_SIZE = 100
+
 
 def nxgraph_stats(graph: nx.Graph):
     degrees = nx.degree_histogram(graph)
@@ -21,6 +28,47 @@ def nxgraph_stats(graph: nx.Graph):
     return stats
 
 
+def get_cached_metric(metric: Callable[[nx.DiGraph], float],
+                      maxsize: int = 1024,
+                      node_attr: Optional[str] = None) -> Callable[[nx.DiGraph], float]:
+    """Wraps graph metric with LRU cache keyed by the exact structure of the graph,
+    i.e. by its edges (with data) between node positions and by the number of nodes.
+    Useful for expensive metrics, because optimizers evaluate the same graph structures
+    many times (e.g. due to elitism or duplicate offspring).
+
+    Args:
+        metric: graph metric that depends only on the structure of the graph
+            and not on the node labels
+        maxsize: maximal number of cached metric values
+        node_attr: name of the node attribute to take into account
+            if the metric depends on it, e.g. ``'name'``
+    """
+    cache = OrderedDict()
+
+    def cached_metric(graph: nx.DiGraph) -> float:
+        key = _graph_structure_key(graph, node_attr)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = metric(graph)
+        cache[key] = value
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return value
+
+    return cached_metric
+
+
+def _graph_structure_key(graph: nx.DiGraph, node_attr: Optional[str] = None) -> tuple:
+    """Returns hashable key that is equal only for graphs with the same adjacency
+    (up to relabeling of nodes that keeps their order)."""
+    node_index = {node: index for index, node in enumerate(graph.nodes)}
+    edges = tuple(sorted((node_index[source], node_index[target], tuple(sorted(data.items())))
+                         for source, target, data in graph.edges(data=True)))
+    node_values = tuple(value for _, value in graph.nodes(data=node_attr)) if node_attr is not None else None
+    return graph.is_directed(), len(node_index), edges, node_values
+
+
 def degree_distance_kernel(target_graph: nx.DiGraph, graph: nx.DiGraph) -> float:
     return degree_stats([graph], [target_graph])
 
@@ -64,8 +112,18 @@ def degree_dist_weighted_compute(degrees_t: Sequence[float],
 
 
 def size_diff(target_graph: nx.DiGraph, graph: nx.DiGraph) -> float:
-    nodes_diff = abs(target_graph.number_of_nodes() - graph.number_of_nodes())
-    edges_diff = abs(target_graph.number_of_edges() - graph.number_of_edges())
+    return _size_diff(target_graph.number_of_nodes(), target_graph.number_of_edges(), graph)
+
+
+def get_size_diff_metric(target_graph: nx.DiGraph) -> Callable[[nx.DiGraph], float]:
+    """Returns metric equivalent to ``partial(size_diff, target_graph)``
+    with the size of the target graph computed only once."""
+    return partial(_size_diff, target_graph.number_of_nodes(), target_graph.number_of_edges())
+
+
+def _size_diff(target_num_nodes: int, target_num_edges: int, graph: nx.DiGraph) -> float:
+    nodes_diff = abs(target_num_nodes - graph.number_of_nodes())
+    edges_diff = abs(target_num_edges - graph.number_of_edges())
     return nodes_diff + np.sqrt(edges_diff)
 
 
@@ -85,17 +143,54 @@ def spectral_dist(target_graph: nx.DiGraph, graph: nx.DiGraph,
     return value
 
 
+def get_spectral_dist_metric(target_graph: nx.DiGraph,
+                             k: int = 20, kind: str = 'laplacian',
+                             size_diff_penalty: float = 0.2,
+                             dtype=np.float32,
+                             ) -> Callable[[nx.DiGraph], float]:
+    """Returns metric equivalent to ``partial(spectral_dist, target_graph, ...)``
+    with ``match_size=False``, except that the spectrum of the target graph
+    is computed only once instead of on each metric call.
+    By default, spectra are computed in single precision (see `graph_spectrum`)."""
+    target_spectrum = graph_spectrum(nx.adjacency_matrix(target_graph), kind=kind, k=k, dtype=dtype)
+    target_size_diff = get_size_diff_metric(target_graph)
+
+    def metric(graph: nx.DiGraph) -> float:
+        spectrum = graph_spectrum(nx.adjacency_matrix(graph), kind=kind, k=k, dtype=dtype)
+        k_common = min(k, len(target_spectrum), len(spectrum))
+        value = spectrum_dist(target_spectrum, spectrum, k=k_common)
+
+        if size_diff_penalty > 1e-5:
+            value += size_diff_penalty * target_size_diff(graph)
+        return value
+
+    return metric
+
+
 def spectral_dists_all(target_graph: nx.DiGraph, graph: nx.DiGraph,
-                       k: int = 20, match_size: bool = True) -> dict:
+                       k: Union[int, Sequence[int]] = 20, match_size: bool = True) -> dict:
+    """Computes spectral distances of all kinds between two graphs.
+    If sequence of `k` is given, then distance of each kind is the list of distances
+    for each value of `k`, computed from the same spectra of the graphs."""
     target_adj = nx.adjacency_matrix(target_graph)
     adj = nx.adjacency_matrix(graph)
 
     print(f'computing metrics for {k} spectral values between {target_adj.shape} & {adj.shape}')
 
+    ks = list(k) if isinstance(k, Sequence) else [k]
+    nmin, nmax = min_max(target_adj.shape[0], adj.shape[0])
+    size = None
+    if match_size:
+        size = nmax
+    else:
+        ks = [min(k_i, nmin) for k_i in ks]
+
     vals = {}
     for kind in ('adjacency', 'laplacian_norm', 'laplacian'):
-        value = lambda_dist(target_adj, adj, kind=kind, k=k, match_size=match_size)
-        vals[kind] = np.round(value, 3)
+        # compute spectra once for all k
+        evals1, evals2 = [graph_spectrum(A, kind=kind, k=max(ks), size=size) for A in [target_adj, adj]]
+        values = [np.round(spectrum_dist(evals1, evals2, k=k_i), 3) for k_i in ks]
+        vals[kind] = values if isinstance(k, Sequence) else values[0]
     vals['nodes_diff'] = size_diff(target_graph, graph)
     return vals
 
@@ -152,28 +247,105 @@ def lambda_dist(A1, A2, k=None, p=2, kind='laplacian', match_size=True):
     """
     # check sizes & determine number of eigenvalues (k)
     nmin, nmax = min_max(A1.shape[0], A2.shape[0])
+    size = None
     if match_size:
-        shape = (nmax, nmax)
-        A1.resize(shape)
-        A2.resize(shape)
+        size = nmax
     else:
         k = min(k, nmin)
 
+    evals1, evals2 = [graph_spectrum(A, kind=kind, k=k, size=size) for A in [A1, A2]]
+    return spectrum_dist(evals1, evals2, k=k, p=p)
+
+
+def graph_spectrum(A, kind='laplacian', k=None, dtype=np.float64, size=None):
+    """Eigenvalues of the matrix of the given `kind` associated with
+    adjacency matrix `A`. Eigenvalues are sorted in the order used
+    by `lambda_dist`: ascending for the Laplacian matrices
+    and descending for the adjacency matrix.
+
+    Parameters
+    ----------
+    A : NumPy or SciPy sparse matrix
+        Adjacency matrix of the graph
+
+    kind : String , in {'laplacian','laplacian_norm','adjacency'}
+        The matrix for which eigenvalues will be calculated.
+
+    k : Integer, optional
+        The number of eigenvalues that are required. If provided, at least
+        first k eigenvalues are returned, otherwise the whole spectrum.
+
+    dtype : NumPy float dtype, optional (default=np.float64)
+        Precision of eigensolver. Single precision is about twice faster
+        and is enough for comparison of graph spectra.
+
+    size : Integer, optional
+        If provided, the spectrum of the adjacency matrix zero-padded
+        to the shape (size, size) is returned.
+
+    Returns
+    -------
+    evals : NumPy array
+        Sorted eigenvalues
+
+    Notes
+    -----
+    For large symmetric sparse matrices (i.e. undirected graphs) only k
+    eigenvalues are computed with the Lanczos method. Directed graphs have
+    non-symmetric (and often defective) matrices, for which Arnoldi iterations
+    are unreliable, so the dense solver is used for them.
+
+    Padding adds isolated nodes to the graph. They only add zero eigenvalues
+    to the adjacency matrix, the Laplacian and the matrix K (see
+    `normalized_laplacian_eig`), so the padded matrix is never built and
+    the eigensolver works with the matrix of the original size.
+    """
     if kind == 'laplacian':
-        # form matrices
-        L1, L2 = [laplacian_matrix(A) for A in [A1, A2]]
-        # get eigenvalues, ignore eigenvectors
-        evals1, evals2 = [_eigs(L)[0] for L in [L1, L2]]
+        M, which = laplacian_matrix(A), 'SA'
     elif kind == 'laplacian_norm':
-        # use our function to graph evals of normalized laplacian
-        evals1, evals2 = [normalized_laplacian_eig(A)[0] for A in [A1, A2]]
+        # eigenvalues of normalized laplacian L = I - K are recovered from K,
+        # see `normalized_laplacian_eig`
+        M, which = _normalized_adjacency(A), 'LA'
     elif kind == 'adjacency':
-        evals1, evals2 = [_eigs(A)[0] for A in [A1, A2]]
-        # reverse, so that we are sorted from large to small, since we care
-        # about the k LARGEST eigenvalues for the adjacency distance
-        evals1, evals2 = [evals[::-1] for evals in [evals1, evals2]]
+        M, which = A, 'LA'
     else:
         raise AttributeError(f"Invalid type {kind}, choose from 'laplacian', "
                              f"'laplacian_norm', and 'adjacency'.")
-    dist = np.linalg.norm(evals1[:k] - evals2[:k], ord=p)
-    return dist
+
+    if _use_truncated_spectrum(M, k):
+        evals = spla.eigsh(M.astype(dtype), k=k, which=which, return_eigenvectors=False)
+    else:
+        M = M.toarray() if sps.issparse(M) else np.asarray(M)
+        evals = np.real(sla.eigvals(M.astype(dtype), check_finite=False))
+
+    if size is not None and size > M.shape[0]:
+        evals = np.concatenate([evals, np.zeros(size - M.shape[0], dtype=evals.dtype)])
+    if kind == 'laplacian_norm':
+        evals = 1 - evals
+    evals = np.sort(evals)
+    if kind == 'adjacency':
+        # reverse, so that we are sorted from large to small, since we care
+        # about the k LARGEST eigenvalues for the adjacency distance
+        evals = evals[::-1]
+    return evals
+
+
+def _use_truncated_spectrum(M, k: Optional[int]) -> bool:
+    n = M.shape[0]
+    return (k is not None and k < n - 1 and n >= MIN_TRUNCATED_SPECTRUM_SIZE
+            and sps.issparse(M) and (M != M.T).nnz == 0)
+
+
+def _normalized_adjacency(A):
+    """Matrix K = D^(-1/2) A D^(-1/2) with zero rows for isolated nodes,
+    the same as used in `normalized_laplacian_eig`."""
+    degs = np.asarray(A.sum(axis=1), dtype=float).ravel()
+    inv_root_degs = np.zeros_like(degs)
+    np.power(degs, -1 / 2, out=inv_root_degs, where=degs > 1e-10)
+    inv_root_d = sps.diags(inv_root_degs, format='csr')
+    return inv_root_d @ A.astype(float) @ inv_root_d
+
+
+def spectrum_dist(evals1, evals2, k=None, p=2):
+    """p-norm of the difference between first `k` values of sorted spectra."""
+    return np.linalg.norm(evals1[:k] - evals2[:k], ord=p)
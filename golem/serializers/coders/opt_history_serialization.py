@@ -44,6 +44,8 @@ def _archive_to_uids(generations_list: List[List[Individual]]) -> List[List[str]
 
 def opt_history_to_json(obj: OptHistory) -> Dict[str, Any]:
     serialized = any_to_json(obj)
+    # cached fitness array is rebuilt on demand, so it is not saved
+    serialized.pop('_fitness_array', None)
     serialized['individuals_pool'] = _flatten_generations_list(serialized['_generations'])
     serialized['_generations'] = _generations_list_to_uids(serialized['_generations'])
     serialized['archive_history'] = _archive_to_uids(serialized['archive_history'])
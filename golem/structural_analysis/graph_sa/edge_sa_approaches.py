@@ -296,21 +296,23 @@ class EdgeReplaceOperationAnalyze(EdgeAnalyzeApproach):
         cur_graph.disconnect_nodes(node_parent=parent_node, node_child=child_node,
                                    clean_up_leftovers=False)
 
-        edges_in_graph = cur_graph.get_edges()
+        # edges are collected once as a set of node id pairs for O(1) lookups in the loop below
+        edges_in_graph = {(id(parent), id(child)) for parent, child in cur_graph.get_edges()}
 
         available_edges_idx = list()
 
-        for parent_node in cur_graph.nodes[1:]:
-            for child_node in cur_graph.nodes:
-                if parent_node == child_node:
+        nodes = cur_graph.nodes
+        for parent_idx, parent_node in enumerate(nodes[1:], start=1):
+            for child_idx, child_node in enumerate(nodes):
+                if parent_node is child_node:
                     continue
-                if [parent_node, child_node] in edges_in_graph or [child_node, parent_node] in edges_in_graph:
+                if (id(parent_node), id(child_node)) in edges_in_graph or \
+                        (id(child_node), id(parent_node)) in edges_in_graph:
                     continue
-                if cur_graph.nodes.index(parent_node) == child_node_index and \
-                        cur_graph.nodes.index(child_node) == parent_node_index:
+                if parent_idx == child_node_index and child_idx == parent_node_index:
                     continue
-                available_edges_idx.append({'parent_node_idx': cur_graph.nodes.index(parent_node),
-                                            'child_node_idx': cur_graph.nodes.index(child_node)})
+                available_edges_idx.append({'parent_node_idx': parent_idx,
+                                            'child_node_idx': child_idx})
 
         edges_for_replacement = random.sample(available_edges_idx, min(number_of_operations, len(available_edges_idx)))
         return edges_for_replacement
@@ -1,7 +1,8 @@
+from math import ceil
 from os.path import join
 from typing import Optional, List, Type
 
-import multiprocessing
+from joblib import Parallel, delayed
 
 from golem.core.log import default_log
 from golem.core.dag.graph import Graph
@@ -12,6 +13,7 @@ from golem.structural_analysis.graph_sa.edge_sa_approaches import EdgeAnalyzeApp
 from golem.structural_analysis.graph_sa.entities.edge import Edge
 from golem.structural_analysis.graph_sa.results.sa_analysis_results import SAAnalysisResults
 from golem.structural_analysis.graph_sa.sa_requirements import StructuralAnalysisRequirements
+from golem.utilities.utilities import determine_n_jobs
 
 
 class EdgesAnalysis:
@@ -57,21 +59,22 @@ class EdgesAnalysis:
         if not results:
             results = SAAnalysisResults()
 
-        if n_jobs == -1:
-            n_jobs = multiprocessing.cpu_count()
+        n_jobs = determine_n_jobs(n_jobs)
 
         if not edges_to_analyze:
             self.log.message('Edges to analyze are not defined. All edges will be analyzed.')
-            edges_to_analyze = [Edge.from_tuple([edge])[0] for edge in graph.get_edges()]
+            edges_to_analyze = Edge.from_tuple(graph.get_edges())
 
         edge_analysis = EdgeAnalysis(approaches=self.approaches,
                                      approaches_requirements=self.requirements,
                                      path_to_save=self.path_to_save)
 
-        with multiprocessing.Pool(processes=n_jobs) as pool:
-            cur_edges_result = pool.starmap(edge_analysis.analyze,
-                                            [[graph, edge, self.objective, timer]
-                                             for edge in edges_to_analyze])
+        # workers of joblib (loky) backend are reused between calls, unlike a new Pool per analysis.
+        # One batch per worker, so the graph is pickled once per worker instead of once per entity.
+        batch_size = max(1, ceil(len(edges_to_analyze) / n_jobs))
+        cur_edges_result = Parallel(n_jobs=n_jobs, batch_size=batch_size)(
+            delayed(edge_analysis.analyze)(graph, edge, self.objective, timer)
+            for edge in edges_to_analyze)
         results.add_results(cur_edges_result)
 
         return results
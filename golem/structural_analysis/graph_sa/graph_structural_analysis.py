@@ -2,7 +2,6 @@ import os
 from copy import deepcopy
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict
-import multiprocessing
 
 from golem.core.log import default_log
 from golem.core.dag.graph import Graph, GraphNode
@@ -21,6 +20,7 @@ from golem.structural_analysis.graph_sa.results.sa_analysis_results import SAAna
 from golem.structural_analysis.graph_sa.results.utils import EntityTypesEnum
 from golem.structural_analysis.graph_sa.sa_approaches_repository import StructuralAnalysisApproachesRepository
 from golem.structural_analysis.graph_sa.sa_requirements import StructuralAnalysisRequirements
+from golem.utilities.utilities import determine_n_jobs
 from golem.visualisation.graph_viz import NodeColorType
 
 
@@ -94,8 +94,8 @@ class GraphStructuralAnalysis:
         if not result:
             result = SAAnalysisResults()
 
-        if n_jobs == -1:
-            n_jobs = multiprocessing.cpu_count()
+        # joblib takes CPU affinity and cgroup limits into account, unlike multiprocessing.cpu_count
+        n_jobs = determine_n_jobs(n_jobs)
 
         if self.is_preproc:
             graph = self.graph_preprocessing(graph=graph)
@@ -1,6 +1,8 @@
+from math import ceil
 from os.path import join
 from typing import Optional, List, Type
-import multiprocessing
+
+from joblib import Parallel, delayed
 
 from golem.core.log import default_log
 from golem.core.dag.graph import Graph, GraphNode
@@ -11,6 +13,7 @@ from golem.core.paths import default_data_dir
 from golem.structural_analysis.graph_sa.node_sa_approaches import NodeAnalyzeApproach, NodeAnalysis
 from golem.structural_analysis.graph_sa.results.sa_analysis_results import SAAnalysisResults
 from golem.structural_analysis.graph_sa.sa_requirements import StructuralAnalysisRequirements
+from golem.utilities.utilities import determine_n_jobs
 
 
 class NodesAnalysis:
@@ -59,8 +62,7 @@ class NodesAnalysis:
         if not results:
             results = SAAnalysisResults()
 
-        if n_jobs == -1:
-            n_jobs = multiprocessing.cpu_count()
+        n_jobs = determine_n_jobs(n_jobs)
 
         if not nodes_to_analyze:
             self.log.message('Nodes to analyze are not defined. All nodes will be analyzed.')
@@ -71,10 +73,12 @@ class NodesAnalysis:
                                      node_factory=self.node_factory,
                                      path_to_save=self.path_to_save)
 
-        with multiprocessing.Pool(processes=n_jobs) as pool:
-            cur_nodes_results = pool.starmap(node_analysis.analyze,
-                                       [[graph, node, self.objective, timer]
-                                        for node in nodes_to_analyze])
+        # workers of joblib (loky) backend are reused between calls, unlike a new Pool per analysis.
+        # One batch per worker, so the graph is pickled once per worker instead of once per entity.
+        batch_size = max(1, ceil(len(nodes_to_analyze) / n_jobs))
+        cur_nodes_results = Parallel(n_jobs=n_jobs, batch_size=batch_size)(
+            delayed(node_analysis.analyze)(graph, node, self.objective, timer)
+            for node in nodes_to_analyze)
 
         results.add_results(cur_nodes_results)
 
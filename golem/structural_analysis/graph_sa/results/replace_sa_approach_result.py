@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from golem.structural_analysis.graph_sa.results.base_sa_approach_result import BaseSAApproachResult
 
@@ -9,21 +9,35 @@ class ReplaceSAApproachResult(BaseSAApproachResult):
         """ Main dictionary `self.metrics` contains entities as key and
         list with metrics as values"""
         self.metrics = dict()
+        # metric index -> (worst value, entity), kept up to date on every addition
+        self._worst_by_metric: Dict[int, Tuple[float, str]] = dict()
 
     def add_results(self, entity_to_replace_to: str, metrics_values: List[float]):
         """ Sets value for specified metric. """
+        if entity_to_replace_to in self.metrics:
+            # overwritten values may have been the worst ones
+            self._worst_by_metric.clear()
+        else:
+            for idx, (worst_value, _) in list(self._worst_by_metric.items()):
+                if metrics_values[idx] > worst_value:
+                    self._worst_by_metric[idx] = (metrics_values[idx], entity_to_replace_to)
         self.metrics[entity_to_replace_to] = metrics_values
 
     def get_worst_result(self, metric_idx_to_optimize_by: int) -> float:
         """ Returns value of the worst metric. """
-        return max([metrics[metric_idx_to_optimize_by] for metrics in list(self.metrics.values())])
+        return self._get_worst(metric_idx_to_optimize_by)[0]
 
     def get_worst_result_with_names(self, metric_idx_to_optimize_by: int) -> dict:
         """ Returns the worst metric among all calculated with its name and node's to replace to name. """
-        worst_value = self.get_worst_result(metric_idx_to_optimize_by=metric_idx_to_optimize_by)
-        for entity in self.metrics:
-            if list(self.metrics[entity])[metric_idx_to_optimize_by] == worst_value:
-                return {'value': worst_value, 'entity_to_replace_to': entity}
+        worst_value, entity = self._get_worst(metric_idx_to_optimize_by)
+        return {'value': worst_value, 'entity_to_replace_to': entity}
+
+    def _get_worst(self, metric_idx: int) -> Tuple[float, str]:
+        """ Returns the worst value for the metric with the first entity it was reached on. """
+        if metric_idx not in self._worst_by_metric:
+            entity = max(self.metrics, key=lambda entity: self.metrics[entity][metric_idx])
+            self._worst_by_metric[metric_idx] = (self.metrics[entity][metric_idx], entity)
+        return self._worst_by_metric[metric_idx]
 
     def get_dict_results(self) -> Dict[int, List[float]]:
         """ Returns dict representation of results. """
@@ -1,6 +1,7 @@
 import json
 import os.path
 from datetime import datetime
+from itertools import chain
 from typing import List, Optional, Union
 
 from golem.core.dag.graph import Graph
@@ -19,12 +20,14 @@ class SAAnalysisResults(Serializable):
 
     def __init__(self):
         self.results_per_iteration = {}
+        # number of the first iteration with empty results for each entity type
+        self._first_empty_iter = {EntityTypesEnum.node.value: 0, EntityTypesEnum.edge.value: 0}
         self._add_empty_iteration_results()
         self.log = default_log('sa_results')
 
     def _add_empty_iteration_results(self):
-        last_iter_num = int(list(self.results_per_iteration.keys())[-1]) if self.results_per_iteration.keys() else -1
-        self.results_per_iteration.update({(last_iter_num + 1): self._init_iteration_result()})
+        # iterations are numbered consecutively starting from 0
+        self.results_per_iteration[len(self.results_per_iteration)] = self._init_iteration_result()
 
     @staticmethod
     def _init_iteration_result() -> dict:
@@ -50,7 +53,7 @@ class SAAnalysisResults(Serializable):
         nodes_results = self.results_per_iteration[iter][EntityTypesEnum.node.value]
         edges_results = self.results_per_iteration[iter][EntityTypesEnum.edge.value]
 
-        for i, res in enumerate(nodes_results + edges_results):
+        for res in chain(nodes_results, edges_results):
             cur_res = res.get_worst_result_with_names(
                 metric_idx_to_optimize_by=metric_idx_to_optimize_by)
             if not worst_value or cur_res['value'] > worst_value:
@@ -63,16 +66,16 @@ class SAAnalysisResults(Serializable):
             return
         key = results[0].entity_type.value
         iter_num = self._get_last_empty_iter(key=key)
-        for result in results:
-            self.results_per_iteration[iter_num][key].append(result)
+        self.results_per_iteration[iter_num][key].extend(results)
+        # results are never removed, so the next iteration becomes the first empty one
+        self._first_empty_iter[key] = iter_num + 1
 
     def _get_last_empty_iter(self, key: str) -> int:
         """ Returns number of last iteration with empty key field. """
-        for i, result in enumerate(self.results_per_iteration.values()):
-            if not result[key]:
-                return i
-        self._add_empty_iteration_results()
-        return list(self.results_per_iteration.keys())[-1]
+        iter_num = self._first_empty_iter[key]
+        if iter_num == len(self.results_per_iteration):
+            self._add_empty_iteration_results()
+        return iter_num
 
     def save(self, path: str = None, datetime_in_path: bool = True) -> dict:
         """ Saves SA results in json format. """
@@ -86,8 +89,6 @@ class SAAnalysisResults(Serializable):
                 for entity in iter_result[entity_type]:
                     dict_results[iter][entity_type].update(entity.get_dict_results())
 
-        json_data = json.dumps(dict_results, cls=Serializer)
-
         if not path:
             path = os.path.join(project_root(), 'sa', 'sa_results.json')
         if datetime_in_path:
@@ -99,7 +100,7 @@ class SAAnalysisResults(Serializable):
             path = os.path.join(path, file_name)
 
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(json_data)
+            json.dump(dict_results, f, cls=Serializer)
             self.log.debug(f'SA results saved in the path: {path}.')
 
         return dict_results
@@ -12,10 +12,9 @@ class EntityTypesEnum(Enum):
 
 def get_entity_from_str(graph: Graph, entity_str: str) -> Union[GraphNode, Tuple[GraphNode, GraphNode]]:
     """ Gets entity from entity str using graph. """
-    if len(entity_str.split('_')) == 2:
-        parent_node_idx, child_node_idx = entity_str.split('_')
-        parent_node = graph.nodes[int(parent_node_idx)]
-        child_node = graph.nodes[int(child_node_idx)]
-        return parent_node, child_node
+    nodes = graph.nodes
+    parent_node_idx, separator, child_node_idx = entity_str.partition('_')
+    if separator:
+        return nodes[int(parent_node_idx)], nodes[int(child_node_idx)]
     else:
-        return graph.nodes[int(entity_str)]
+        return nodes[int(entity_str)]
@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Optional, Sequence, Union, TYPE_CHECKING
 
 import numpy as np
 from matplotlib import pyplot as plt
@@ -33,10 +33,22 @@ def compute_fitness_diversity(population: PopulationT) -> np.ndarray:
     # substitutes None values
     fitness_values = np.array([ind.fitness.values for ind in population], dtype=float)
     # compute std along each axis while ignoring nan-s
-    diversity = np.nanstd(fitness_values, axis=0)
+    diversity = _std(fitness_values, axis=0)
     return diversity
 
 
+def _quantile(values: np.ndarray, q: Union[float, Sequence[float]], axis: Optional[int] = None) -> np.ndarray:
+    """Computes quantiles ignoring nan-s. Much slower ``np.nanquantile`` is used only if there are nan-s."""
+    quantile = np.nanquantile if np.isnan(values).any() else np.quantile
+    return quantile(values, q, axis=axis)
+
+
+def _std(values: np.ndarray, axis: Optional[int] = None) -> np.ndarray:
+    """Computes standard deviation ignoring nan-s, ``np.nanstd`` is used only if there are nan-s."""
+    std = np.nanstd if np.isnan(values).any() else np.std
+    return std(values, axis=axis)
+
+
 def plot_diversity_dynamic_gif(history: 'OptHistory',
                                filename: Optional[str] = None,
                                fig_size: int = 5,
@@ -47,13 +59,17 @@ def plot_diversity_dynamic_gif(history: 'OptHistory',
     # dtype=float removes None, puts np.nan
     # indexed by [population, metric, individual] after transpose (.T)
     pops = history.generations[1:-1]  # ignore initial pop and final choices
-    fitness_distrib = [np.array([ind.fitness.values for ind in pop], dtype=float).T
-                       for pop in pops]
+    fitness_array = history.fitness_array[1:-1]
+    fitness_distrib = [pop_values[:len(pop)].T
+                       for pop, pop_values in zip(pops, fitness_array)]
 
-    # Define bounds on metrics: find min & max on a flattened view of array
+    # Compute quantiles of all populations at once, indexed by [quantile, population, metric]
     q = 0.025
-    lims_max = np.max([np.quantile(pop, 1 - q, axis=1) for pop in fitness_distrib], axis=0)
-    lims_min = np.min([np.quantile(pop, q, axis=1) for pop in fitness_distrib], axis=0)
+    violin_quantiles = [0.25, 0.5, 0.75]
+    quantiles = _quantile(fitness_array, [q, 1 - q, *violin_quantiles], axis=1)
+    # Define bounds on metrics: find min & max among all populations
+    lims_min, lims_max = np.min(quantiles[0], axis=0), np.max(quantiles[1], axis=0)
+    violin_quantiles_values = quantiles[2:]
 
     # Setup the plot
     ncols = max(len(metric_names), 1)
@@ -61,24 +77,36 @@ def plot_diversity_dynamic_gif(history: 'OptHistory',
     fig.set_size_inches(fig_size * ncols, fig_size)
     axs = np.atleast_1d(np.ravel(axs))
 
+    # Prepare axes once, only violins and titles are changed between frames
+    for i, ax in enumerate(axs):
+        ax: plt.Axes
+        ax.set_xlim(0.5, 1.5)
+        ax.set_ylim(lims_min[i], lims_max[i])
+        ax.set_ylabel('Metric value')
+        ax.grid()
+    violins = []
+
     # Set update function for updating data on the axes
     def update_axes(iframe: int):
+        # Remove violins of the previous frame
+        for violin_parts in violins:
+            for part in violin_parts.values():
+                # violin bodies are stored as a list of artists
+                for artist in (part if isinstance(part, list) else [part]):
+                    artist.remove()
+        violins.clear()
+        # Plot information
+        fig.suptitle(f'Population {iframe+1} diversity by metric')
         for i, (ax, metric_distrib) in enumerate(zip(axs, fitness_distrib[iframe])):
-            # Clear & Prepare axes
-            ax: plt.Axes
-            ax.clear()
-            ax.set_xlim(0.5, 1.5)
-            ax.set_ylim(lims_min[i], lims_max[i])
-            ax.set_ylabel('Metric value')
-            ax.grid()
-            # Plot information
-            fig.suptitle(f'Population {iframe+1} diversity by metric')
             metric_name = metric_names[i] if metric_names else f"metric{i}"
             ax.set_title(f'{metric_name}, '
                          f'mean={np.mean(metric_distrib).round(3)}, '
-                         f'std={np.nanstd(metric_distrib).round(3)}')
-            ax.violinplot(metric_distrib,
-                          quantiles=[0.25, 0.5, 0.75])
+                         f'std={_std(metric_distrib).round(3)}')
+            violin_parts = ax.violinplot(metric_distrib)
+            # quantiles are precomputed, so they are drawn the same way as violinplot does
+            violin_parts['cquantiles'] = ax.hlines(violin_quantiles_values[:, iframe, i], 0.75, 1.25,
+                                                   colors=violin_parts['cbars'].get_color())
+            violins.append(violin_parts)
 
     # Run this function in FuncAnimation
     num_frames = len(fitness_distrib)
@@ -101,10 +129,21 @@ def plot_diversity_dynamic(history: 'OptHistory',
     xs = np.arange(len(h))
 
     # Compute diversity by metrics
-    np_history = np.array([compute_fitness_diversity(pop) for pop in h])
+    # std along individuals axis of all populations at once, padding nan-s are ignored
+    np_history = np.nanstd(history.fitness_array[:-1], axis=1)
     ys = {label: np_history[:, i] for i, label in enumerate(labels)}
     # Compute number of unique individuals, plot
-    ratio_unique = [len(set(ind.graph.descriptive_id for ind in pop)) / len(pop) for pop in h]
+    # the same individuals are usually kept in several generations,
+    # so descriptive id of the graph is computed once per individual
+    descriptive_ids = {}
+    ratio_unique = []
+    for pop in h:
+        pop_ids = set()
+        for ind in pop:
+            if ind.uid not in descriptive_ids:
+                descriptive_ids[ind.uid] = ind.graph.descriptive_id
+            pop_ids.add(descriptive_ids[ind.uid])
+        ratio_unique.append(len(pop_ids) / len(pop))
 
     fig, ax = plt.subplots()
     fig.suptitle('Population diversity')
@@ -37,9 +37,6 @@ class GenealogicalPath(HistoryVisualization):
         :param evolution_time_s: time in seconds for the part of the animation where the evolution process is shown.
         :param hold_result_time_s: time in seconds for the part of the animation where the final result is shown.
         """
-        # Treating all graphs as equally distant if there's no reasonable way to compare them:
-        graph_dist = graph_dist or (lambda g1, g2: 1)
-
         def draw_graph(graph: Graph, ax, title, highlight_title=False):
             ax.clear()
             ax.set_title(title, fontsize=22, color='green' if highlight_title else 'black')
@@ -108,14 +105,20 @@ class GenealogicalPath(HistoryVisualization):
             self.log.error(f"Failed to render the genealogical path: {e}")
 
 
-def trace_genealogical_path(individual: Individual, graph_dist: Callable[[Graph, Graph], float]) -> List[Individual]:
+def trace_genealogical_path(individual: Individual,
+                            graph_dist: Optional[Callable[[Graph, Graph], float]] = None) -> List[Individual]:
     # Choose nearest parent each time:
     genealogical_path: List[Individual] = [individual]
-    while genealogical_path[-1].parents_from_prev_generation:
-        genealogical_path.append(max(
-            genealogical_path[-1].parents_from_prev_generation,
-            key=partial(graph_dist, genealogical_path[-1])
-        ))
+    # parents are traced through the whole operators chain, so they are obtained once per step
+    parents = individual.parents_from_prev_generation
+    while parents:
+        if len(parents) == 1 or graph_dist is None:
+            # e.g. after mutation there is nothing to choose from, so the distance is not computed.
+            # Without distance all graphs are treated as equally distant, so the first parent is taken
+            genealogical_path.append(parents[0])
+        else:
+            genealogical_path.append(max(parents, key=partial(graph_dist, genealogical_path[-1])))
+        parents = genealogical_path[-1].parents_from_prev_generation
 
     return list(reversed(genealogical_path))
 
@@ -0,0 +1,28 @@
+import pytest
+
+from golem.core.optimisers.adaptive.reward_agent import FitnessRateRankRewardTransformer
+
+
+@pytest.mark.parametrize('decay_values, expected_rates',
+                         [([1., 3.], [0.25, 0.75]),
+                          ([1., -3.], [0.5, -1.5]),
+                          ([2., -2.], [0., 0.])])
+def test_fitness_rank_rate(decay_values, expected_rates):
+    """ Tests that decay values are normalized by the absolute value of their sum. """
+    rates = FitnessRateRankRewardTransformer.get_fitness_rank_rate(decay_values)
+    assert rates == pytest.approx(expected_rates)
+
+
+def test_decay_values_for_arms():
+    """ Tests that rewards are summed up per arm and scaled by decaying factor. """
+    transformer = FitnessRateRankRewardTransformer(decaying_factor=0.5)
+    unique_arms, decay_values = transformer.get_decay_values_for_arms(rewards=[1., 2., 3., 4.], arms=[3, 0, 3, 1])
+    assert unique_arms == [0, 1, 3]
+    assert decay_values == pytest.approx([1., 2., 2.])
+
+
+def test_rewards_for_arms():
+    """ Tests that each arm gets the fitness rank rate of its accumulated rewards. """
+    transformer = FitnessRateRankRewardTransformer()
+    rewards = transformer.get_rewards_for_arms(rewards=[1., 2., 1.], arms=[2, 0, 2])
+    assert rewards == pytest.approx([0.5, 0.5, 0.5])
@@ -27,6 +27,16 @@ def test_graph_id():
     assert final.descriptive_id == right_id
 
 
+def test_graph_id_with_cycle():
+    right_id = '(((ID_CYCLED;)/n_n1;)/n_n2;;((ID_CYCLED;)/n_n2;)/n_n1;)/n_n3'
+    first = GraphNode(content='n1')
+    second = GraphNode(content='n2', nodes_from=[first])
+    first.nodes_from = [second]
+    final = GraphNode(content='n3', nodes_from=[first, second])
+
+    assert final.descriptive_id == right_id
+
+
 def test_graph_str():
     # given
     first = GraphNode(content='n1')
@@ -323,5 +333,20 @@ def test_graph_deepcopy(graph: Graph):
     assert graph.root_node.descriptive_id != graph_copy.root_node.descriptive_id
 
 
+def test_graph_deepcopy_keeps_structure():
+    first = GraphNode(content='n1')
+    second = GraphNode(content='n2', nodes_from=[first])
+    third = GraphNode(content='n3', nodes_from=[first])
+    graph = GraphImpl(GraphNode(content='n4', nodes_from=[second, third]))
+
+    graph_copy = deepcopy(graph)
+
+    assert graph_copy.descriptive_id == graph.descriptive_id
+    assert [node.uid for node in graph_copy.nodes] == [node.uid for node in graph.nodes]
+    assert not set(map(id, graph_copy.nodes)) & set(map(id, graph.nodes))
+    for node in graph_copy.nodes:
+        assert all(any(parent is copy_node for copy_node in graph_copy.nodes) for parent in node.nodes_from)
+
+
 def _modify_graph_copy(graph: Graph):
     graph.root_node.content['name'] = 'n2'
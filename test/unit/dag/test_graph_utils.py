@@ -2,7 +2,7 @@ import pytest
 
 from golem.core.dag.graph_utils import distance_to_primary_level
 from golem.core.dag.graph_utils import nodes_from_layer, distance_to_root_level, ordered_subnodes_hierarchy, \
-    graph_has_cycle, node_depth
+    graph_has_cycle, node_depth, map_dag_nodes
 from golem.core.dag.linked_graph_node import LinkedGraphNode
 from test.unit.dag.test_graph_operator import graph
 from test.unit.utils import graph_first, simple_cycled_graph, branched_cycled_graph, graph_second, graph_third, \
@@ -71,6 +71,17 @@ def test_ordered_subnodes_hierarchy():
     assert ordered_nodes == [root, third_node, first_node, second_node]
 
 
+def test_ordered_subnodes_hierarchy_deep_chain():
+    chain_length = 5000
+    nodes = [LinkedGraphNode('a')]
+    for _ in range(chain_length - 1):
+        nodes.append(LinkedGraphNode('b', nodes_from=[nodes[-1]]))
+
+    ordered_nodes = ordered_subnodes_hierarchy(nodes[-1])
+
+    assert ordered_nodes == nodes[::-1]
+
+
 def test_ordered_subnodes_cycle():
     cycle_node = LinkedGraphNode('knn')
     second_node = LinkedGraphNode('knn')
@@ -97,3 +108,27 @@ def test_node_depth(graph, nodes_names, correct_depths):
     nodes = [graph.get_nodes_by_name(name)[0] for name in nodes_names]
     depths = node_depth(nodes)
     assert depths == correct_depths
+
+
+def test_node_depth_deep_chain():
+    chain_length = 5000
+    nodes = [LinkedGraphNode('a')]
+    for _ in range(chain_length - 1):
+        nodes.append(LinkedGraphNode('b', nodes_from=[nodes[-1]]))
+
+    assert node_depth(nodes[-1]) == chain_length
+    assert node_depth([nodes[-1], nodes[chain_length // 2]]) == chain_length
+
+
+def test_map_dag_nodes_deep_chain():
+    chain_length = 5000
+    nodes = [LinkedGraphNode('a')]
+    for _ in range(chain_length - 1):
+        nodes.append(LinkedGraphNode('b', nodes_from=[nodes[-1]]))
+
+    mapped_nodes = map_dag_nodes(lambda node: LinkedGraphNode(dict(node.content)), nodes[::-1])
+
+    assert len(mapped_nodes) == chain_length
+    assert all(mapped_node.nodes_from == [mapped_parent]
+               for mapped_node, mapped_parent in zip(mapped_nodes, mapped_nodes[1:]))
+    assert not mapped_nodes[-1].nodes_from
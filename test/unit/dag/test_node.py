@@ -1,3 +1,5 @@
+import numpy as np
+
 from golem.core.dag.linked_graph_node import LinkedGraphNode
 
 
@@ -26,3 +28,16 @@ def test_node_description_with_params():
 
     # then
     assert actual_node_description == expected_node_description
+
+
+def test_node_with_str_subclass_name():
+    # given
+    content = {'name': np.str_('logit')}
+
+    # when
+    test_model_node = LinkedGraphNode(content)
+
+    # then
+    assert test_model_node.name == 'logit'
+    assert test_model_node.description() == 'n_logit'
+    assert type(content['name']) is np.str_
@@ -0,0 +1,14 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from golem.metrics.graph_features import clustering_coefficients
+
+
+@pytest.mark.parametrize('graph', [nx.gnp_random_graph(50, p=0.2, seed=1),
+                                   nx.gnp_random_graph(50, p=0.2, seed=1, directed=True),
+                                   nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 0), (2, 2)]),
+                                   nx.star_graph(5)])
+def test_clustering_coefficients_match_networkx(graph):
+    expected = list(nx.clustering(graph).values())
+    assert np.allclose(clustering_coefficients(graph), expected)
@@ -0,0 +1,46 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from examples.synthetic_graph_evolution.generators import generate_labeled_graph
+from golem.metrics.graph_metrics import get_cached_metric, get_spectral_dist_metric, spectral_dist
+
+
+@pytest.mark.parametrize('kind', ['adjacency', 'laplacian', 'laplacian_norm'])
+def test_spectral_dist_metric_matches_spectral_dist(kind):
+    target_graph = generate_labeled_graph('gnp', 40)
+    metric = get_spectral_dist_metric(target_graph, kind=kind, dtype=np.float64)
+
+    for size in (5, 30, 60):
+        graph = generate_labeled_graph('gnp', size)
+        assert np.isclose(metric(graph), spectral_dist(target_graph, graph, kind=kind))
+
+
+def test_cached_metric_evaluates_same_structure_once():
+    calls = []
+
+    def metric(graph):
+        calls.append(graph)
+        return graph.number_of_edges()
+
+    cached_metric = get_cached_metric(metric, maxsize=2)
+    graph = generate_labeled_graph('tree', 10)
+    same_graph = nx.relabel_nodes(graph, {node: f'n{node}' for node in graph.nodes})
+    other_graph = generate_labeled_graph('line', 10)
+
+    assert cached_metric(graph) == cached_metric(same_graph) == graph.number_of_edges()
+    assert len(calls) == 1
+    assert cached_metric(other_graph) == other_graph.number_of_edges()
+    assert len(calls) == 2
+
+
+def test_cached_metric_distinguishes_graphs_with_same_wl_hash():
+    cycle_graph = nx.cycle_graph(12, create_using=nx.DiGraph)
+    small_cycle = nx.cycle_graph(6, create_using=nx.DiGraph)
+    two_cycles_graph = nx.disjoint_union(small_cycle, small_cycle)
+    assert nx.weisfeiler_lehman_graph_hash(cycle_graph) == nx.weisfeiler_lehman_graph_hash(two_cycles_graph)
+
+    cached_metric = get_cached_metric(nx.number_weakly_connected_components)
+
+    assert cached_metric(cycle_graph) == 1
+    assert cached_metric(two_cycles_graph) == 2
@@ -5,7 +5,7 @@ from itertools import product
 import numpy as np
 import pytest
 
-from golem.core.optimisers.fitness import null_fitness, SingleObjFitness, MultiObjFitness
+from golem.core.optimisers.fitness import Fitness, null_fitness, SingleObjFitness, MultiObjFitness
 from golem.core.optimisers.objective.objective import to_fitness
 from golem.serializers import Serializer
 
@@ -133,3 +133,17 @@ def test_universal_fitness_compare():
 
     assert to_fitness([1., 1., 3.], multi_objective=False).dominates(to_fitness([1., 2., 1.], multi_objective=False))
     assert not to_fitness([1., 1., 3.], multi_objective=True).dominates(to_fitness([1., 2., 1.], multi_objective=True))
+
+
+@pytest.mark.parametrize('fitness, expected_metric',
+                         [(null_fitness(), 100.),
+                          (SingleObjFitness(11, 2), 11),
+                          (MultiObjFitness([1., 2.]), (1., 2.)),
+                          (MultiObjFitness([1., 2.], weights=-1), (-1., -2.))])
+def test_fitness_to_metric(fitness, expected_metric):
+    assert fitness.to_metric(default=100.) == expected_metric
+
+
+@pytest.mark.parametrize('fitness', [null_fitness(), SingleObjFitness(11), MultiObjFitness([1., 2.], weights=-1)])
+def test_base_fitness_to_metric_matches_overrides(fitness):
+    assert Fitness.to_metric(fitness, default=100.) == fitness.to_metric(default=100.)
@@ -232,6 +232,21 @@ def test_all_historical_quality(generate_history):
     assert all_quality[0] == -0.9 and all_quality[4] == -1.4 and all_quality[5] == -1.3 and all_quality[10] == -1.2
 
 
+def test_history_fitness_array():
+    history = OptHistory()
+    history.add_to_history([create_individual() for _ in range(3)])
+    history.add_to_history([create_individual() for _ in range(2)])
+
+    fitness_array = history.fitness_array
+    assert fitness_array.shape == (2, 3, 2)
+    assert np.allclose(fitness_array[1, :2], [ind.fitness.values for ind in history.generations[1]])
+    assert np.all(np.isnan(fitness_array[1, 2]))
+    assert history.fitness_array is fitness_array
+
+    history.add_to_history([create_individual()])
+    assert history.fitness_array.shape == (3, 3, 2)
+
+
 @pytest.mark.parametrize('n_jobs', [1, 2])
 def test_newly_generated_history(n_jobs: int):
     num_of_gens = 5
@@ -9,6 +9,7 @@ from golem.core.tuning.optuna_tuner import OptunaTuner
 from golem.core.tuning.search_space import SearchSpace
 from golem.core.tuning.sequential import SequentialTuner
 from golem.core.tuning.simultaneous import SimultaneousTuner
+from golem.core.tuning.tuner_interface import EarlyStoppingMonitor
 from test.unit.mocks.common_mocks import (MockAdapter, MockDomainStructure, MockNode, MockObjectiveEvaluate,
                                           mock_graph_with_params, opt_graph_with_params)
 from test.unit.utils import ParamsProductMetric, ParamsSumMetric
@@ -150,3 +151,63 @@ def test_hyperopt_returns_native_types(search_space, tuner_cls):
         for param, val in node.parameters.items():
             assert val.__class__.__module__ != 'numpy', (f'The parameter "{param}" should not be a numpy type. '
                                                          f'Got "{type(val)}".')
+
+
+def test_tuner_init_graph_with_unpicklable_params(search_space):
+    obj_eval = ObjectiveEvaluate(Objective({'sum_metric': ParamsSumMetric.get_value}))
+    tuner = SimultaneousTuner(obj_eval, search_space, iterations=1)
+    graph = opt_graph_with_params()
+    graph.nodes[0].parameters = {'callback': lambda x: x}
+    tuner.init_check(graph)
+
+    assert tuner.init_graph is not graph
+    assert tuner.init_graph.descriptive_id == graph.descriptive_id
+
+    other_graph = opt_graph_with_params()
+    tuner.init_graph = other_graph
+
+    assert tuner.init_graph is other_graph
+
+
+@pytest.mark.parametrize('cache_metrics, evaluations_num', [(True, 1), (False, 2)])
+def test_tuner_metric_cache(search_space, cache_metrics, evaluations_num):
+    evaluated_graphs = []
+
+    def counting_metric(graph):
+        evaluated_graphs.append(graph)
+        return ParamsSumMetric.get_value(graph)
+
+    obj_eval = ObjectiveEvaluate(Objective({'sum_metric': counting_metric}))
+    tuner = SimultaneousTuner(obj_eval, search_space, iterations=1, cache_metrics=cache_metrics)
+    graph = opt_graph_with_params()
+    tuner.init_check(graph)
+    metric = tuner.get_metric_value(deepcopy(graph))
+
+    assert metric == tuner.init_metric
+    assert len(evaluated_graphs) == evaluations_num
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_tuner_get_metric_values(search_space, parallel):
+    obj_eval = ObjectiveEvaluate(Objective({'sum_metric': ParamsSumMetric.get_value}))
+    tuner = SimultaneousTuner(obj_eval, search_space, iterations=1, n_jobs=2)
+    graph = opt_graph_with_params()
+    other_graph = opt_graph_with_params()
+    other_graph.nodes[0].parameters = {'a1': 3}
+    tuner.init_check(graph)
+
+    metrics = tuner.get_metric_values([other_graph, deepcopy(graph), other_graph], parallel=parallel)
+
+    assert metrics == [tuner.get_metric_value(other_graph), tuner.init_metric, tuner.get_metric_value(other_graph)]
+
+
+@pytest.mark.parametrize('metrics, min_delta, should_stop',
+                         [([3., 2., 2., 2.], 0., True),
+                          ([3., 2., 2., 1.], 0., False),
+                          ([3., 2., 1.95, 1.9], 0.1, True),
+                          ([3., None, None, 1.], 0., False)])
+def test_early_stopping_monitor(metrics, min_delta, should_stop):
+    monitor = EarlyStoppingMonitor(rounds=2, min_delta=min_delta)
+    for metric in metrics:
+        monitor.update(metric)
+    assert monitor.should_stop == should_stop
@@ -22,7 +22,8 @@ def graphs_same(left: Graph, right: Graph) -> bool:
 
 
 def find_same_node(nodes: List[GraphNode], target: GraphNode) -> Optional[GraphNode]:
-    return next(filter(lambda n: n.descriptive_id == target.descriptive_id, nodes), None)
+    target_id = target.descriptive_id
+    return next((node for node in nodes if node.descriptive_id == target_id), None)
 
 
 def find_first(graph, predicate: Callable[[GraphNode], bool]) -> Optional[GraphNode]:
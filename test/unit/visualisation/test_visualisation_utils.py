@@ -3,7 +3,7 @@ from golem.core.dag.convert import graph_structure_as_nx_graph
 from golem.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.visualisation.graph_viz import GraphVisualizer
-from golem.visualisation.opt_viz_extra import extract_objectives
+from golem.visualisation.opt_viz_extra import extract_objectives, objectives_lists
 from test.unit.utils import graph_first
 
 
@@ -65,3 +65,8 @@ def test_extract_objectives():
     all_objectives = extract_objectives(individuals=individuals_history, transform_from_minimization=True)
     assert all_objectives[0][0] > 0 and all_objectives[0][2] > 0
     assert all_objectives[1][0] > 0 and all_objectives[1][2] > 0
+
+
+def test_objectives_lists_of_empty_individuals():
+    assert objectives_lists([], objectives_numbers=(0, 1)) == [[], []]
+    assert extract_objectives([[], []], objectives_numbers=(0, 1)) == [[], []]